@@ -1,47 +1,167 @@
 """Database connection and session management for ticket tracking."""
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+import threading
+import time
+from functools import lru_cache
+from sqlalchemy import create_engine, event, func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, selectinload, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 from .models import Base
 from typing import Optional
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./tickets.db")
 
-# Create engine
-if DATABASE_URL.startswith("sqlite"):
-    # SQLite configuration for development
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False  # Set to True for SQL debugging
-    )
-else:
+# Page size limits for search_tickets
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
+
+# How long cached read results (metrics, ticket history) stay fresh
+CACHE_TTL_SECONDS = float(os.getenv("DB_CACHE_TTL_SECONDS", "30"))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL so readers on pooled connections don't block the writer."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+@lru_cache(maxsize=None)
+def _get_engine(url: str) -> Engine:
+    """Create the engine for a database URL, once per process."""
+    if url.startswith("sqlite"):
+        # SQLite configuration for development
+        if ":memory:" in url or url in ("sqlite://", "sqlite:///"):
+            # An in-memory database only exists on its one connection
+            return create_engine(
+                url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+                query_cache_size=1200,  # Keep compiled ORM statements across calls
+                echo=False  # Set to True for SQL debugging
+            )
+        
+        sqlite_engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            query_cache_size=1200,  # Keep compiled ORM statements across calls
+            echo=False  # Set to True for SQL debugging
+        )
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+
     # PostgreSQL configuration for production
-    engine = create_engine(
-        DATABASE_URL,
+    return create_engine(
+        url,
         echo=False,
+        query_cache_size=1200,  # Keep compiled ORM statements across calls
+        pool_size=20,
+        max_overflow=40,
         pool_pre_ping=True,
         pool_recycle=300
     )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@lru_cache(maxsize=None)
+def _get_sessionmaker(url: str) -> sessionmaker:
+    """Create the session factory bound to the engine for a database URL."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=_get_engine(url))
+
+
+# Module-level handles kept for existing importers
+engine = _get_engine(DATABASE_URL)
+SessionLocal = _get_sessionmaker(DATABASE_URL)
+
+
+_initialized = False
 
 
 def init_database():
-    """Initialize the database and create tables."""
+    """Initialize the database and create tables, once per process."""
+    global _initialized
+    if _initialized:
+        return
+    
     try:
         Base.metadata.create_all(bind=engine)
+        # create_all skips indexes on tables that already exist
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+        _initialized = True
         print("✅ Database initialized successfully")
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
         raise
 
 
+class _ReadCache:
+    """Thread-safe in-process TTL cache for read-mostly query results."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+    
+    def set(self, key, value) -> None:
+        """Store a value for key until the TTL runs out."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def get_or_load(self, key, load):
+        """
+        Return the cached value for key, calling load() on a miss.
+        
+        Concurrent misses on the same key wait for the first caller's load
+        instead of each running the query. None results are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is None:
+                value = load()
+                if value is not None:
+                    self.set(key, value)
+        with self._lock:
+            if not key_lock.locked():
+                self._loading.pop(key, None)
+        return value
+    
+    def discard(self, *keys) -> None:
+        """Drop the given keys if cached."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
 def get_db() -> Session:
     """Get database session."""
     db = SessionLocal()
@@ -54,26 +174,55 @@ def get_db() -> Session:
 class DatabaseManager:
     """Database manager for ticket operations."""
     
-    def __init__(self):
-        self.engine = engine
-        self.SessionLocal = SessionLocal
+    def __init__(self, database_url: str = DATABASE_URL):
+        self.engine = _get_engine(database_url)
+        self.SessionLocal = _get_sessionmaker(database_url)
+        self._cache = _ReadCache(CACHE_TTL_SECONDS)
     
     def get_session(self) -> Session:
         """Get a new database session."""
         return self.SessionLocal()
     
-    def create_ticket(self, session: Session, **ticket_data) -> 'Ticket':
-        """Create a new ticket."""
-        from .models import Ticket, generate_ticket_id
+    def invalidate(self, ticket_id: Optional[str] = None) -> None:
+        """
+        Drop cached reads after a write.
+        
+        Clears the metrics counts and the given ticket's history, or every
+        cached entry when no ticket ID is known.
+        """
+        if ticket_id is None:
+            self._cache.clear()
+        else:
+            self._cache.discard("metrics", ("history", ticket_id))
+    
+    def create_ticket(self, session: Session, status_message: Optional[str] = None, updated_by: str = "ai_agent", **ticket_data) -> 'Ticket':
+        """
+        Create a new ticket.
+        
+        When status_message is given, the ticket's first status update record
+        is written in the same transaction.
+        """
+        from .models import Ticket, TicketStatus, TicketStatusUpdate, generate_ticket_id
         
         # Generate ticket ID if not provided
         if 'ticket_id' not in ticket_data:
             ticket_data['ticket_id'] = generate_ticket_id()
         
         ticket = Ticket(**ticket_data)
+        if status_message is not None:
+            # The column default is only applied at insert, so fill it in
+            # here for the status update record to copy
+            if ticket.status is None:
+                ticket.status = TicketStatus.OPEN
+            ticket.status_updates.append(TicketStatusUpdate(
+                status=ticket.status,
+                message=status_message,
+                updated_by=updated_by
+            ))
         session.add(ticket)
         session.commit()
         session.refresh(ticket)
+        self._cache.discard("metrics")
         return ticket
     
     def get_ticket(self, session: Session, ticket_id: str) -> Optional['Ticket']:
@@ -81,101 +230,209 @@ class DatabaseManager:
         from .models import Ticket
         return session.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
     
+    def get_ticket_with_history(self, session: Session, ticket_id: str) -> Optional['Ticket']:
+        """Get ticket by ID with status updates and resolution attempts loaded up front."""
+        from .models import Ticket
+        return (
+            session.query(Ticket)
+            .options(
+                selectinload(Ticket.status_updates),
+                selectinload(Ticket.resolution_attempts)
+            )
+            .filter(Ticket.ticket_id == ticket_id)
+            .first()
+        )
+    
     def update_ticket_status(self, session: Session, ticket_id: str, status: str, message: Optional[str] = None, updated_by: str = "ai_agent") -> bool:
         """Update ticket status and create status update record."""
-        from .models import Ticket, TicketStatus, TicketStatusUpdate
+        from .models import Ticket, TicketStatusUpdate, status_from
         
-        ticket = self.get_ticket(session, ticket_id)
-        if not ticket:
-            return False
+        status_enum = status_from(status)
         
-        # Update ticket status
-        ticket.status = TicketStatus(status)
+        # Update the status and get the row id back in a single statement
+        ticket_pk = session.execute(
+            update(Ticket)
+            .where(Ticket.ticket_id == ticket_id)
+            .values(status=status_enum)
+            .returning(Ticket.id)
+        ).scalar_one_or_none()
+        if ticket_pk is None:
+            return False
         
-        # Create status update record
+        # Create status update record in the same transaction
         status_update = TicketStatusUpdate(
-            ticket_id=ticket.id,
-            status=TicketStatus(status),
+            ticket_id=ticket_pk,
+            status=status_enum,
             message=message,
             updated_by=updated_by
         )
         
         session.add(status_update)
         session.commit()
+        self.invalidate(ticket_id)
+        return True
+    
+    def record_escalation(self, session: Session, ticket_id: str, team_name: str, channel: str, slack_message_ts: Optional[str] = None, routing_reason: Optional[str] = None) -> bool:
+        """
+        Mark a ticket escalated to a team and log the assignment.
+        
+        The ticket update, its status update record and the team assignment
+        audit record are written in one transaction. Returns False if no
+        ticket has the given ID.
+        """
+        from .models import Ticket, TeamAssignment, TicketStatus, TicketStatusUpdate
+        
+        row = session.execute(
+            update(Ticket)
+            .where(Ticket.ticket_id == ticket_id)
+            .values(
+                status=TicketStatus.ESCALATED,
+                assigned_team=team_name,
+                slack_channel=channel,
+                slack_message_ts=slack_message_ts
+            )
+            .returning(Ticket.id, Ticket.priority)
+        ).one_or_none()
+        if row is None:
+            session.rollback()
+            return False
+        
+        session.add_all([
+            TicketStatusUpdate(
+                ticket_id=row.id,
+                status=TicketStatus.ESCALATED,
+                message=f"Escalated to {team_name} in {channel}",
+                updated_by="ai_agent"
+            ),
+            TeamAssignment(
+                ticket_id=row.id,
+                team_name=team_name,
+                channel_name=channel,
+                priority=row.priority,
+                routing_reason=routing_reason
+            ),
+        ])
+        session.commit()
+        self.invalidate(ticket_id)
         return True
     
-    def add_resolution_attempt(self, session: Session, ticket_id: str, **attempt_data) -> 'ResolutionAttempt':
-        """Add a resolution attempt to a ticket."""
-        from .models import Ticket, ResolutionAttempt
+    def add_resolution_attempt(self, session: Session, ticket_id: str, ticket_status: Optional[str] = None, status_message: Optional[str] = None, updated_by: str = "ai_agent", **attempt_data) -> 'ResolutionAttempt':
+        """
+        Add a resolution attempt to a ticket.
+        
+        When ticket_status is given, the ticket's status change and its status
+        update record are written in the same transaction as the attempt.
+        """
+        from .models import Ticket, ResolutionAttempt, TicketStatusUpdate, status_from
         
-        ticket = self.get_ticket(session, ticket_id)
-        if not ticket:
+        # Resolve the ticket row and next attempt number without loading the attempts
+        next_attempt = (
+            select(func.coalesce(func.max(ResolutionAttempt.attempt_number), 0) + 1)
+            .where(ResolutionAttempt.ticket_id == Ticket.id)
+            .scalar_subquery()
+        )
+        row = session.execute(
+            select(Ticket.id, next_attempt).where(Ticket.ticket_id == ticket_id)
+        ).first()
+        if not row:
             raise ValueError(f"Ticket {ticket_id} not found")
         
-        # Get attempt number
-        attempt_number = len(ticket.resolution_attempts) + 1
+        ticket_pk, attempt_number = row
         
         resolution_attempt = ResolutionAttempt(
-            ticket_id=ticket.id,
+            ticket_id=ticket_pk,
             attempt_number=attempt_number,
             **attempt_data
         )
         
         session.add(resolution_attempt)
+        
+        if ticket_status is not None:
+            status_enum = status_from(ticket_status)
+            session.execute(
+                update(Ticket)
+                .where(Ticket.id == ticket_pk)
+                .values(status=status_enum)
+            )
+            session.add(TicketStatusUpdate(
+                ticket_id=ticket_pk,
+                status=status_enum,
+                message=status_message,
+                updated_by=updated_by
+            ))
+        
         session.commit()
         session.refresh(resolution_attempt)
+        self.invalidate(ticket_id)
         return resolution_attempt
     
     def get_ticket_history(self, session: Session, ticket_id: str) -> dict:
-        """Get complete ticket history including status updates and resolution attempts."""
-        from .models import Ticket, get_ticket_summary
+        """
+        Get complete ticket history including status updates and resolution attempts.
         
-        ticket = self.get_ticket(session, ticket_id)
-        if not ticket:
-            return None
+        Results are cached for CACHE_TTL_SECONDS and dropped on writes to the
+        ticket; treat the returned dict as read-only.
+        """
+        from .models import get_ticket_summary
         
-        history = {
-            "ticket": get_ticket_summary(ticket),
-            "status_updates": [
-                {
-                    "status": update.status.value,
-                    "message": update.message,
-                    "updated_by": update.updated_by,
-                    "created_at": update.created_at.isoformat() if update.created_at else None
-                }
-                for update in ticket.status_updates
-            ],
-            "resolution_attempts": [
-                {
-                    "attempt_number": attempt.attempt_number,
-                    "agent_type": attempt.agent_type,
-                    "solution_provided": attempt.solution_provided,
-                    "user_feedback": attempt.user_feedback,
-                    "status": attempt.status.value,
-                    "feedback_analysis": attempt.feedback_analysis,
-                    "created_at": attempt.created_at.isoformat() if attempt.created_at else None
-                }
-                for attempt in ticket.resolution_attempts
-            ]
-        }
+        def load():
+            ticket = self.get_ticket_with_history(session, ticket_id)
+            if not ticket:
+                return None
+            
+            history = {
+                "ticket": get_ticket_summary(ticket),
+                "status_updates": [
+                    {
+                        "status": update.status.value,
+                        "message": update.message,
+                        "updated_by": update.updated_by,
+                        "created_at": update.created_at.isoformat() if update.created_at else None
+                    }
+                    for update in ticket.status_updates
+                ],
+                "resolution_attempts": [
+                    {
+                        "attempt_number": attempt.attempt_number,
+                        "agent_type": attempt.agent_type,
+                        "solution_provided": attempt.solution_provided,
+                        "user_feedback": attempt.user_feedback,
+                        "status": attempt.status.value,
+                        "feedback_analysis": attempt.feedback_analysis,
+                        "created_at": attempt.created_at.isoformat() if attempt.created_at else None
+                    }
+                    for attempt in ticket.resolution_attempts
+                ]
+            }
+            
+            return history
         
-        return history
+        return self._cache.get_or_load(("history", ticket_id), load)
     
     def search_tickets(self, session: Session, **filters) -> list:
-        """Search tickets with various filters."""
-        from .models import Ticket, TicketStatus, TicketPriority, TicketCategory
+        """
+        Search tickets with various filters.
+        
+        The status filter takes one status or a list of them, so tickets in
+        several states are fetched in a single query.
+        """
+        from .models import Ticket, status_from, priority_from, category_from
         
         query = session.query(Ticket)
         
         # Apply filters
         if 'status' in filters:
-            query = query.filter(Ticket.status == TicketStatus(filters['status']))
+            status = filters['status']
+            if isinstance(status, (list, tuple, set, frozenset)):
+                query = query.filter(Ticket.status.in_([status_from(s) for s in status]))
+            else:
+                query = query.filter(Ticket.status == status_from(status))
         
         if 'priority' in filters:
-            query = query.filter(Ticket.priority == TicketPriority(filters['priority']))
+            query = query.filter(Ticket.priority == priority_from(filters['priority']))
         
         if 'category' in filters:
-            query = query.filter(Ticket.category == TicketCategory(filters['category']))
+            query = query.filter(Ticket.category == category_from(filters['category']))
         
         if 'assigned_team' in filters:
             query = query.filter(Ticket.assigned_team == filters['assigned_team'])
@@ -186,11 +443,45 @@ class DatabaseManager:
         # Order by creation date (newest first)
         query = query.order_by(Ticket.created_at.desc())
         
-        # Apply limit if specified
-        if 'limit' in filters:
-            query = query.limit(filters['limit'])
+        # Always page results, capped so a single call cannot load the whole
+        # table. The model picks these values, and SQLite reads LIMIT -1 as
+        # no limit, so out-of-range ones are clamped.
+        limit = max(1, min(filters.get('limit') or DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT))
+        offset = max(0, filters.get('offset') or 0)
+        query = query.limit(limit).offset(offset)
         
         return query.all()
+    
+    def metrics_counts(self, session: Session) -> dict:
+        """
+        Count tickets in total and grouped by status, priority, category and team.
+        
+        Results are cached for CACHE_TTL_SECONDS and dropped on writes; treat
+        the returned dict as read-only.
+        """
+        from .models import Ticket
+        
+        def load():
+            grouped_columns = {
+                "status": Ticket.status,
+                "priority": Ticket.priority,
+                "category": Ticket.category,
+                "assigned_team": Ticket.assigned_team,
+            }
+            
+            counts = {
+                "total": session.scalar(select(func.count()).select_from(Ticket)) or 0
+            }
+            for name, column in grouped_columns.items():
+                rows = session.execute(select(column, func.count()).group_by(column))
+                counts[name] = {
+                    getattr(key, "value", key): count
+                    for key, count in rows
+                }
+            
+            return counts
+        
+        return self._cache.get_or_load("metrics", load)
 
 
 # Global database manager instance
@@ -0,0 +1,64 @@
+"""Shared Gemini model for all agents, with a cap on concurrent model calls."""
+
+import asyncio
+import os
+import weakref
+from typing import AsyncGenerator
+
+from google.adk.models import Gemini, LlmRequest, LlmResponse
+
+MODEL_NAME = "gemini-2.5-flash"
+
+# Most model calls allowed in flight per event loop; the rest wait their turn
+MAX_INFLIGHT_MODEL_CALLS = int(os.getenv("MAX_INFLIGHT_MODEL_CALLS", "64"))
+
+_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _inflight_limit() -> asyncio.Semaphore:
+    """Get the running event loop's model-call semaphore."""
+    loop = asyncio.get_running_loop()
+    limit = _limits.get(loop)
+    if limit is None:
+        limit = _limits[loop] = asyncio.Semaphore(MAX_INFLIGHT_MODEL_CALLS)
+    return limit
+
+
+class BoundedGemini(Gemini):
+    """
+    Gemini model that waits for a free slot before each request.
+
+    A burst of sessions would otherwise send every request at once and hit
+    Gemini's rate limits together, with each retry competing with the rest.
+    Capping in-flight calls queues the overflow in order instead.
+
+    A slot covers only the upstream request, never a paused ``yield``. ADK
+    runs tools and transferred sub-agents while the caller is paused on a
+    response, and those make model calls of their own; holding the slot
+    across them would let parents waiting on children fill every slot.
+    """
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        responses = super().generate_content_async(llm_request, stream)
+        if not stream:
+            async with _inflight_limit():
+                collected = [response async for response in responses]
+            for response in collected:
+                yield response
+            return
+
+        # Streamed chunks are yielded as they arrive, so take the slot only
+        # while waiting for the next one
+        while True:
+            async with _inflight_limit():
+                try:
+                    response = await responses.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield response
+
+
+# One instance shared by every agent, so they also share its API client
+model = BoundedGemini(model=MODEL_NAME)
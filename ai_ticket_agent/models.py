@@ -1,11 +1,13 @@
 """Database models for ticket tracking and lifecycle management."""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from datetime import datetime
+import time
+import uuid
+from typing import Union
 
 Base = declarative_base()
 
@@ -75,6 +77,15 @@ class Ticket(Base):
     status_updates = relationship("TicketStatusUpdate", back_populates="ticket", cascade="all, delete-orphan")
     resolution_attempts = relationship("ResolutionAttempt", back_populates="ticket", cascade="all, delete-orphan")
     
+    # Indexes matching the search_tickets filters, which always sort newest first
+    __table_args__ = (
+        Index("ix_ticket_status_created", "status", "created_at"),
+        Index("ix_ticket_priority_created", "priority", "created_at"),
+        Index("ix_ticket_category_created", "category", "created_at"),
+        Index("ix_ticket_team_created", "assigned_team", "created_at"),
+        Index("ix_ticket_user_created", "user_email", "created_at"),
+    )
+    
     def __repr__(self):
         return f"<Ticket(id={self.id}, ticket_id='{self.ticket_id}', status='{self.status.value}')>"
 
@@ -84,7 +95,7 @@ class TicketStatusUpdate(Base):
     __tablename__ = "ticket_status_updates"
     
     id = Column(Integer, primary_key=True, index=True)
-    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False)
+    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False, index=True)
     status = Column(Enum(TicketStatus), nullable=False)
     message = Column(Text, nullable=True)
     updated_by = Column(String(100), nullable=False)  # "ai_agent", "human_team", "user"
@@ -102,7 +113,7 @@ class ResolutionAttempt(Base):
     __tablename__ = "resolution_attempts"
     
     id = Column(Integer, primary_key=True, index=True)
-    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False)
+    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False, index=True)
     attempt_number = Column(Integer, nullable=False, default=1)
     agent_type = Column(String(50), nullable=False)  # "self_service", "escalation"
     solution_provided = Column(Text, nullable=False)
@@ -138,8 +149,8 @@ class TeamAssignment(Base):
 # Helper functions for ticket lifecycle management
 def generate_ticket_id() -> str:
     """Generate a unique ticket ID."""
-    import uuid
-    return f"TICKET-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+    t = time.localtime()
+    return f"TICKET-{t.tm_year}{t.tm_mon:02d}{t.tm_mday:02d}-{uuid.uuid4().hex[:8].upper()}"
 
 
 def get_ticket_summary(ticket: Ticket) -> dict:
@@ -156,4 +167,39 @@ def get_ticket_summary(ticket: Ticket) -> dict:
         "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None,
         "resolution_attempts": len(ticket.resolution_attempts),
         "status_updates": len(ticket.status_updates)
-    } 
\ No newline at end of file
+    } 
+
+# Cached value -> member lookups used on the ticket write and filter paths
+_STATUS = {member.value: member for member in TicketStatus}
+_PRIORITY = {member.value: member for member in TicketPriority}
+_CATEGORY = {member.value: member for member in TicketCategory}
+
+
+def status_from(value: Union[str, TicketStatus]) -> TicketStatus:
+    """Get the TicketStatus for a value or member, raising ValueError if unknown."""
+    if isinstance(value, TicketStatus):
+        return value
+    try:
+        return _STATUS[value]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a valid TicketStatus") from None
+
+
+def priority_from(value: Union[str, TicketPriority]) -> TicketPriority:
+    """Get the TicketPriority for a value or member, raising ValueError if unknown."""
+    if isinstance(value, TicketPriority):
+        return value
+    try:
+        return _PRIORITY[value]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a valid TicketPriority") from None
+
+
+def category_from(value: Union[str, TicketCategory]) -> TicketCategory:
+    """Get the TicketCategory for a value or member, raising ValueError if unknown."""
+    if isinstance(value, TicketCategory):
+        return value
+    try:
+        return _CATEGORY[value]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a valid TicketCategory") from None
@@ -0,0 +1,279 @@
+"""SLA timers for open tickets.
+
+Response SLAs are plain arithmetic on ticket age and priority, so they are
+tracked with a heap of deadlines instead of asking a model. Each ticket raises
+one alert at 80%, 90% and 100% of its SLA window.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import timezone
+from string import Template
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ai_ticket_agent.taxonomy import DEFAULT_PRIORITY, DEFAULT_TEAM, PRIORITY_RANKS, PRIORITY_SLA_HOURS, PRIORITY_SLAS, TEAM_CHANNELS
+
+logger = logging.getLogger(__name__)
+
+# SLA window per priority, in seconds
+SLA_SECONDS: Dict[str, int] = {
+    priority: hours * 3600 for priority, hours in PRIORITY_SLA_HOURS.items()
+}
+
+# Fraction of the SLA window at which each alert level fires
+SLA_MARKS: Tuple[Tuple[float, str], ...] = (
+    (0.8, "warning"),
+    (0.9, "critical"),
+    (1.0, "breach"),
+)
+
+ALERT_TEMPLATES: Dict[str, Template] = {
+    "warning": Template("⏰ SLA warning: $ticket_id ($priority) has used 80% of its $sla response SLA"),
+    "critical": Template("🔥 SLA critical: $ticket_id ($priority) has used 90% of its $sla response SLA"),
+    "breach": Template("🚨 SLA breached: $ticket_id ($priority) is past its $sla response SLA"),
+}
+
+# Ticket statuses that still count against the SLA
+TRACKED_STATUSES = ("open", "in_progress", "escalated")
+
+# How often the monitor reloads open tickets from the database
+RESYNC_SECONDS = 60
+
+# Longest alert digest posted as one Slack message; Slack rejects section
+# text longer than this
+MAX_DIGEST_TEXT = 3000
+
+
+class SLAAlert(NamedTuple):
+    """An SLA mark reached by a ticket."""
+    ticket_id: str
+    priority: str
+    level: str
+    team: Optional[str]
+
+
+class TrackedTicket(NamedTuple):
+    """A ticket as seen by the SLA timers."""
+    ticket_id: str
+    priority: str
+    created_at: float
+    team: Optional[str] = None
+
+
+def format_alert(alert: SLAAlert) -> str:
+    """Render the message for an SLA alert."""
+    return ALERT_TEMPLATES[alert.level].substitute(
+        ticket_id=alert.ticket_id,
+        priority=alert.priority.upper(),
+        sla=PRIORITY_SLAS.get(alert.priority, PRIORITY_SLAS[DEFAULT_PRIORITY])
+    )
+
+
+class SLATimers:
+    """
+    Min-heap of SLA deadlines for tracked tickets.
+
+    Heap entries are never removed in place. A ticket whose priority changes or
+    that stops being tracked leaves stale entries behind, and those are skipped
+    when they reach the top of the heap.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str, str, Tuple[float, str]]] = []
+        self._schedules: Dict[str, Tuple[float, str]] = {}
+        self._teams: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def schedule(self, ticket: TrackedTicket, now: Optional[float] = None) -> None:
+        """
+        Start timers for a ticket, or restart them if its priority changed.
+
+        Marks that already passed collapse into the most severe one, which is
+        due immediately, so a late start raises a single alert.
+        """
+        now = time.time() if now is None else now
+        key = (ticket.created_at, ticket.priority)
+        self._teams[ticket.ticket_id] = ticket.team
+        if self._schedules.get(ticket.ticket_id) == key:
+            return
+
+        self._schedules[ticket.ticket_id] = key
+        window = SLA_SECONDS.get(ticket.priority, SLA_SECONDS[DEFAULT_PRIORITY])
+        passed = None
+        for fraction, level in SLA_MARKS:
+            due = ticket.created_at + fraction * window
+            if due <= now:
+                passed = level
+            else:
+                heapq.heappush(self._heap, (due, ticket.ticket_id, level, key))
+        if passed:
+            heapq.heappush(self._heap, (now, ticket.ticket_id, passed, key))
+
+    def discard(self, ticket_id: str) -> None:
+        """Stop tracking a ticket."""
+        self._schedules.pop(ticket_id, None)
+        self._teams.pop(ticket_id, None)
+
+    def resync(self, tickets: Iterable[TrackedTicket], now: Optional[float] = None) -> None:
+        """Make the tracked set match the given tickets."""
+        now = time.time() if now is None else now
+        seen = set()
+        for ticket in tickets:
+            seen.add(ticket.ticket_id)
+            self.schedule(ticket, now)
+        for ticket_id in list(self._schedules):
+            if ticket_id not in seen:
+                self.discard(ticket_id)
+
+    def next_deadline(self) -> Optional[float]:
+        """Time of the earliest pending mark, or None when nothing is pending."""
+        while self._heap:
+            due, ticket_id, _, key = self._heap[0]
+            if self._schedules.get(ticket_id) == key:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: Optional[float] = None) -> List[SLAAlert]:
+        """Remove and return every mark that is due."""
+        now = time.time() if now is None else now
+        alerts = []
+        while self._heap and self._heap[0][0] <= now:
+            _, ticket_id, level, key = heapq.heappop(self._heap)
+            if self._schedules.get(ticket_id) != key:
+                continue
+            alerts.append(SLAAlert(ticket_id, key[1], level, self._teams.get(ticket_id)))
+        return alerts
+
+
+def load_tracked_tickets() -> List[TrackedTicket]:
+    """Load tickets that still count against their SLA from the database."""
+    from sqlalchemy import select
+    from ai_ticket_agent.database import db_manager
+    from ai_ticket_agent.models import Ticket, status_from
+
+    session = db_manager.get_session()
+    try:
+        rows = session.execute(
+            select(Ticket.ticket_id, Ticket.priority, Ticket.created_at, Ticket.assigned_team)
+            .where(Ticket.status.in_([status_from(status) for status in TRACKED_STATUSES]))
+        )
+        tickets = []
+        for ticket_id, priority, created_at, team in rows:
+            # SQLite hands back naive UTC timestamps
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            tickets.append(TrackedTicket(ticket_id, priority.value, created_at.timestamp(), team))
+        return tickets
+    finally:
+        session.close()
+
+
+def alert_digests(alerts: Iterable[SLAAlert]) -> Dict[str, List[str]]:
+    """
+    Group alert messages into digests per team channel.
+
+    Alerts that fall due together, as after a monitor restart, are posted as
+    one message per channel instead of one each. A digest is split into
+    several messages only when it outgrows MAX_DIGEST_TEXT.
+    """
+    digests: Dict[str, List[str]] = {}
+    for alert in alerts:
+        channel = TEAM_CHANNELS.get(alert.team, TEAM_CHANNELS[DEFAULT_TEAM])
+        messages = digests.setdefault(channel, [])
+        text = format_alert(alert)
+        if messages and len(messages[-1]) + 1 + len(text) <= MAX_DIGEST_TEXT:
+            messages[-1] += "\n" + text
+        else:
+            messages.append(text)
+    return digests
+
+
+def _post_digest(channel: str, messages: List[str]) -> None:
+    """Post one channel's alert digest, in order."""
+    from ai_ticket_agent.tools.slack_handlers import send_slack_notification
+
+    for text in messages:
+        result = send_slack_notification(channel, {
+            "text": text,
+            "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]
+        })
+        if not result["success"]:
+            logger.error("Failed to send SLA alerts to %s: %s", channel, result.get("error"))
+
+
+def _most_urgent(alerts: Iterable[SLAAlert]) -> str:
+    """Priority of the most urgent ticket among alerts."""
+    return min(
+        (alert.priority for alert in alerts),
+        key=lambda priority: PRIORITY_RANKS.get(priority, PRIORITY_RANKS[DEFAULT_PRIORITY]),
+        default=DEFAULT_PRIORITY
+    )
+
+
+def send_sla_alerts(alerts: List[SLAAlert]) -> None:
+    """
+    Post SLA alerts to the assigned teams' Slack channels.
+
+    Each channel's digest is queued on the shared background pool, so one
+    slow channel does not hold up the others. Messages for the same channel
+    keep their order.
+    """
+    from ai_ticket_agent.tools.concurrency import dispatch
+
+    for channel, messages in alert_digests(alerts).items():
+        urgent = _most_urgent(
+            alert for alert in alerts
+            if TEAM_CHANNELS.get(alert.team, TEAM_CHANNELS[DEFAULT_TEAM]) == channel
+        )
+        dispatch(_post_digest, channel, messages, priority=urgent)
+
+
+async def run_monitor(
+    load: Callable[[], Iterable[TrackedTicket]] = load_tracked_tickets,
+    notify: Callable[[List[SLAAlert]], None] = send_sla_alerts,
+    resync_seconds: float = RESYNC_SECONDS
+) -> None:
+    """
+    Watch SLA deadlines and send alerts as marks are reached.
+
+    A single task sleeps until the next deadline or database resync,
+    whichever comes first. Loading runs on a worker thread, and alerts are
+    queued on the shared background pool without waiting for delivery.
+
+    Args:
+        load: Returns the tickets that should be tracked
+        notify: Called with the alerts that fall due together
+        resync_seconds: How often to reload tickets
+    """
+    from ai_ticket_agent.tools.concurrency import dispatch
+
+    timers = SLATimers()
+    next_sync = 0.0
+    while True:
+        now = time.time()
+        if now >= next_sync:
+            timers.resync(await asyncio.to_thread(load), now)
+            next_sync = now + resync_seconds
+
+        alerts = timers.pop_due(now)
+        if alerts:
+            # Post in the background so slow Slack calls do not push back the
+            # next deadline; the most urgent ticket sets the queue lane
+            dispatch(notify, alerts, priority=_most_urgent(alerts))
+
+        deadline = timers.next_deadline()
+        wake_at = next_sync if deadline is None else min(deadline, next_sync)
+        await asyncio.sleep(max(0.0, wake_at - time.time()))
+
+
+if __name__ == "__main__":
+    print("⏱️  SLA monitor running (Ctrl+C to stop)")
+    try:
+        asyncio.run(run_monitor())
+    except KeyboardInterrupt:
+        pass
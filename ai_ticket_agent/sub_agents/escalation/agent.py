@@ -1,24 +1,27 @@
 """Escalation agent for routing complex IT problems to human teams."""
 
 from google.adk.agents import Agent
-from ai_ticket_agent import prompt
+from ai_ticket_agent import llm, prompt
 from ai_ticket_agent.tools.slack_handlers import slack_escalation_tool
 from ai_ticket_agent.tools.team_router import team_router_tool
 from ai_ticket_agent.tools.notification_sender import escalation_notification_tool
 from ai_ticket_agent.tools.ticket_manager import create_ticket_tool
 from ai_ticket_agent.tools.ticket_manager import update_ticket_tool
+from ai_ticket_agent.tools.concurrency import offload
+from ai_ticket_agent.tools.declarations import CachedFunctionTool
 
 escalation_agent = Agent(
-    model="gemini-2.5-flash",
+    model=llm.model,
     name="escalation_agent",
     description="Routes complex IT problems to appropriate human teams via Slack",
-    instruction=prompt.ESCALATION_AGENT_INSTR,
+    instruction=prompt.with_ticket_context(prompt.ESCALATION_AGENT_INSTR),
     tools=[
-        team_router_tool,
-        slack_escalation_tool,
-        escalation_notification_tool,
-        create_ticket_tool,
-        update_ticket_tool
+        CachedFunctionTool(team_router_tool),
+        # Database, Slack and SMTP calls run off the event loop
+        CachedFunctionTool(offload(slack_escalation_tool)),
+        CachedFunctionTool(offload(escalation_notification_tool)),
+        CachedFunctionTool(offload(create_ticket_tool)),
+        CachedFunctionTool(offload(update_ticket_tool))
     ],
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
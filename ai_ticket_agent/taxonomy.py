@@ -0,0 +1,220 @@
+"""Static IT support taxonomy: teams, channels, priorities and categories.
+
+These tables are the single source for facts the agents used to re-derive from
+prompt text. Tools use them for a cheap keyword match before falling back to
+the LLM's own judgement.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, Optional, Tuple
+
+DEFAULT_TEAM = "General IT Support"
+
+# Slack channel per team
+TEAM_CHANNELS: Dict[str, str] = {
+    "Network Team": "#it-network-support",
+    "Security Team": "#it-security-support",
+    "Hardware Team": "#it-hardware-support",
+    "Software Team": "#it-software-support",
+    "Access Management": "#it-access-support",
+    "Infrastructure Team": "#it-infrastructure-support",
+    "General IT Support": "#it-general-support",
+}
+
+# Ticket category (TicketCategory value) per team
+TEAM_CATEGORIES: Dict[str, str] = {
+    "Network Team": "network",
+    "Security Team": "security",
+    "Hardware Team": "hardware",
+    "Software Team": "software",
+    "Access Management": "access",
+    "Infrastructure Team": "infrastructure",
+    "General IT Support": "general",
+}
+
+# Channel slug (the part after "#it-") back to team name
+CHANNEL_TEAMS: Dict[str, str] = {
+    channel[len("#it-"):].split("-")[0]: team
+    for team, channel in TEAM_CHANNELS.items()
+}
+
+# Single-word keywords that point at a team. General IT Support has none; it
+# is what a ticket gets when nothing more specific matches.
+TEAM_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "Network Team": frozenset({
+        "vpn", "firewall", "wifi", "wi-fi", "wireless", "bandwidth",
+        "internet", "connectivity", "router", "routing", "ethernet", "network",
+    }),
+    "Security Team": frozenset({
+        "security", "malware", "virus", "phishing", "breach", "suspicious",
+        "ransomware", "hacked", "compromised", "spyware", "trojan",
+    }),
+    "Hardware Team": frozenset({
+        "laptop", "desktop", "monitor", "keyboard", "mouse", "printer",
+        "scanner", "hardware", "battery", "screen", "dock", "charger",
+    }),
+    "Software Team": frozenset({
+        "crm", "erp", "application", "app", "software", "install",
+        "installation", "bug", "crash", "crashes", "license", "excel",
+        "outlook",
+    }),
+    "Access Management": frozenset({
+        "account", "permission", "permissions", "access", "password",
+        "provisioning", "locked", "unlock", "role", "onboarding", "sso",
+    }),
+    "Infrastructure Team": frozenset({
+        "server", "servers", "outage", "dns", "dhcp", "backup", "restore",
+        "cloud", "datacenter", "downtime", "storage",
+    }),
+}
+
+# Keywords that raise a ticket above the default medium priority, checked in
+# order so the most urgent level wins
+PRIORITY_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "critical": frozenset({
+        "outage", "breach", "ransomware", "emergency", "compromised",
+    }),
+    "high": frozenset({
+        "urgent", "asap", "deadline", "blocked",
+    }),
+}
+
+DEFAULT_PRIORITY = "medium"
+
+# Scheduling rank per priority, most urgent first
+PRIORITY_RANKS: Dict[str, int] = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+# Response-time SLA per priority, in hours and as display text
+PRIORITY_SLA_HOURS: Dict[str, int] = {
+    "critical": 1,
+    "high": 4,
+    "medium": 8,
+    "low": 24,
+}
+
+PRIORITY_SLAS: Dict[str, str] = {
+    priority: f"{hours} hour{'s' if hours != 1 else ''}"
+    for priority, hours in PRIORITY_SLA_HOURS.items()
+}
+
+# Sub-agent a ticket goes to once triage has picked its team. Only teams whose
+# every issue is escalation work in the agent prompts are listed. The rest
+# cover both kinds, like printer setup next to hardware failures, or password
+# resets next to access violations, so the LLM decides from the issue itself.
+SELF_SERVICE_AGENT = "self_service_agent"
+ESCALATION_AGENT = "escalation_agent"
+
+TEAM_ROUTES: Dict[str, str] = {
+    "Security Team": ESCALATION_AGENT,
+    "Infrastructure Team": ESCALATION_AGENT,
+}
+
+# A team is only picked without the LLM when it has at least this many
+# keyword hits and more than twice as many as any other team
+TEAM_MATCH_MIN_HITS = 2
+
+
+def _keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to the teams and priorities it signals."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for label, keywords in list(TEAM_KEYWORDS.items()) + list(PRIORITY_KEYWORDS.items()):
+        for keyword in keywords:
+            index[keyword] = index.get(keyword, ()) + (label,)
+    return index
+
+
+_KEYWORD_LABELS = _keyword_index()
+
+# One case-insensitive alternation over every keyword, so a ticket is scanned
+# in a single pass. Longest keywords come first so they win at a position.
+_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in sorted(_KEYWORD_LABELS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _scan(text: str) -> Counter:
+    """Count distinct keyword hits per team and priority label."""
+    hits = Counter()
+    for keyword in {match.lower() for match in _KEYWORD_RE.findall(text)}:
+        hits.update(_KEYWORD_LABELS[keyword])
+    return hits
+
+
+def _team_from_hits(hits: Counter) -> Optional[str]:
+    """Pick the dominant team from keyword hits, if there is one."""
+    scores = sorted(((hits[team], team) for team in TEAM_KEYWORDS), reverse=True)
+    (best, team), (runner_up, _) = scores[0], scores[1]
+    if best >= TEAM_MATCH_MIN_HITS and best > 2 * runner_up:
+        return team
+    return None
+
+
+def _priority_from_hits(hits: Counter) -> str:
+    """Pick the most urgent priority level with a keyword hit."""
+    for priority in PRIORITY_KEYWORDS:
+        if hits[priority]:
+            return priority
+    return DEFAULT_PRIORITY
+
+
+def match_team(text: str) -> Optional[str]:
+    """
+    Pick a team by keyword when one team clearly dominates.
+
+    Args:
+        text: Problem description or ticket text
+
+    Returns:
+        The team name, or None when the match is weak or ambiguous
+    """
+    return _team_from_hits(_scan(text))
+
+
+def match_priority(text: str) -> str:
+    """
+    Suggest a priority from urgency keywords.
+
+    Args:
+        text: Problem description or ticket text
+
+    Returns:
+        The most urgent matching priority, or DEFAULT_PRIORITY
+    """
+    return _priority_from_hits(_scan(text))
+
+
+def match_triage(text: str) -> Tuple[Optional[str], str]:
+    """
+    Match team and priority together from a single keyword scan.
+
+    Args:
+        text: Problem description or ticket text
+
+    Returns:
+        The match_team and match_priority results for the text
+    """
+    hits = _scan(text)
+    return _team_from_hits(hits), _priority_from_hits(hits)
+
+
+def match_route(team: Optional[str], priority: str) -> Optional[str]:
+    """
+    Pick the sub-agent for a triaged ticket from the routing table.
+
+    Args:
+        team: Team from match_team, or None
+        priority: Priority from match_priority
+
+    Returns:
+        The sub-agent name, or None when the LLM should decide
+    """
+    if priority == "critical":
+        return ESCALATION_AGENT
+    return TEAM_ROUTES.get(team)
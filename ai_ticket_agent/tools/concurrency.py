@@ -0,0 +1,113 @@
+"""Concurrency helpers for running blocking tools without stalling the agent event loop."""
+
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, List, Tuple
+
+from ai_ticket_agent.taxonomy import DEFAULT_PRIORITY, PRIORITY_RANKS
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for fire-and-forget work such as notification emails. Its worker
+# threads are joined at interpreter exit, so queued sends still complete.
+_background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ticket-agent-bg")
+
+# Most calls allowed to wait for a pool thread. Past this, dispatch runs the
+# call on the caller's thread, which slows new work down instead of letting
+# the backlog grow without bound. A caller on an event loop hands the call
+# to the loop's executor instead, so the loop keeps running.
+MAX_PENDING = 10000
+
+# Work waiting for a pool thread, ordered by (priority rank, arrival order)
+_pending: List[Tuple[int, int, Future, Callable[..., Any], tuple, dict]] = []
+_pending_lock = threading.Lock()
+_arrival = itertools.count()
+
+
+def offload(func: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    Wrap a blocking tool so ADK awaits it on a worker thread.
+
+    ADK awaits async tools but calls plain functions inline on the event loop,
+    so a slow database or network call blocks every other session. The wrapper
+    keeps the tool's name, docstring and signature, which ADK uses to build the
+    function declaration sent to the model.
+
+    Args:
+        func: The synchronous tool function
+
+    Returns:
+        An async tool function running ``func`` via ``asyncio.to_thread``
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _run_next() -> None:
+    """Run the most urgent pending call on the current pool thread."""
+    with _pending_lock:
+        _, _, future, func, args, kwargs = heapq.heappop(_pending)
+    _run(future, func, args, kwargs)
+
+
+def _run(future: Future, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+    """Run a dispatched call and settle its future."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as exc:
+        # Nobody waits on these futures, so report the failure here
+        logger.exception("Background task %s failed", getattr(func, "__qualname__", func))
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def dispatch(func: Callable[..., Any], *args, priority: str = DEFAULT_PRIORITY, **kwargs) -> Future:
+    """
+    Run a blocking call in the background without waiting for its result.
+
+    Used for side effects the user does not need to wait on, like SMTP sends,
+    so the tool can return as soon as the work is queued. When the pool is
+    busy, queued calls start in ticket priority order, so a critical ticket's
+    notification does not wait behind a backlog of low priority ones. Once
+    MAX_PENDING calls are waiting, the call runs before dispatch returns,
+    or on the event loop's default executor when called from a running loop.
+
+    Args:
+        func: The function to run
+        *args: Positional arguments for ``func``
+        priority: Ticket priority lane (critical, high, medium, low); not
+            passed on to ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The Future for the queued call
+    """
+    future = Future()
+    rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[DEFAULT_PRIORITY])
+    with _pending_lock:
+        backlogged = len(_pending) >= MAX_PENDING
+        if not backlogged:
+            heapq.heappush(_pending, (rank, next(_arrival), future, func, args, kwargs))
+    if backlogged:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _run(future, func, args, kwargs)
+        else:
+            loop.run_in_executor(None, _run, future, func, args, kwargs)
+        return future
+    # Each pool task pops whichever pending call is most urgent when it starts
+    _background.submit(_run_next)
+    return future
@@ -0,0 +1,24 @@
+"""Function tools whose model-facing declarations are built once."""
+
+from typing import Optional
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+
+class CachedFunctionTool(FunctionTool):
+    """
+    FunctionTool that keeps the function declaration it builds.
+
+    ADK turns plain functions into fresh FunctionTools and re-derives their
+    declarations from the signature and docstring on every model request.
+    Tool signatures never change at runtime, so agents hand ADK instances of
+    this class, built at import, and the first declaration is reused.
+    """
+
+    _declaration: Optional[types.FunctionDeclaration] = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        if self._declaration is None:
+            self._declaration = super()._get_declaration()
+        return self._declaration
@@ -4,6 +4,10 @@ from google.adk.tools import ToolContext
 from typing import Dict, Any
 import re
 
+# Email address anywhere in a message, and a whole string that is one address
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_FORMAT_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$')
+
 
 def collect_user_email(user_message: str, tool_context: ToolContext) -> str:
     """
@@ -18,12 +22,14 @@ def collect_user_email(user_message: str, tool_context: ToolContext) -> str:
     """
     
     # Check if email is already in the message
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, user_message)
+    match = EMAIL_RE.search(user_message)
     
-    if emails:
+    if match:
         # Email found in message
-        user_email = emails[0]
+        user_email = match.group()
+        if tool_context is not None:
+            # Sub-agents read this from session state instead of asking again
+            tool_context.state["user_email"] = user_email
         return f"""
         **Email Address Collected:**
         - Email: {user_email}
@@ -62,8 +68,7 @@ def validate_email_format(email: str) -> bool:
     Returns:
         bool: True if email format is valid
     """
-    email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-    return bool(re.match(email_pattern, email))
+    return bool(EMAIL_FORMAT_RE.match(email))
 
 
 # The tool is just the function itself
@@ -1,7 +1,126 @@
 """Knowledge base tool for IT support solutions."""
 
+import re
+from functools import lru_cache
 from google.adk.tools import ToolContext
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+
+# Mock knowledge base - in production, this would connect to a real knowledge base
+KNOWLEDGE_BASE = {
+    "password reset": """
+    **Password Reset Process:**
+    1. Go to https://password.company.com
+    2. Enter your username
+    3. Click "Reset Password"
+    4. Check your email for reset link
+    5. Create a new password following security requirements
+    6. Log in with new password
+    
+    **Security Requirements:**
+    - Minimum 8 characters
+    - Include uppercase, lowercase, number, and special character
+    - Cannot reuse last 5 passwords
+    """,
+    
+    "vpn connection": """
+    **VPN Connection Troubleshooting:**
+    1. Check internet connection
+    2. Open VPN client application
+    3. Enter your username and password
+    4. If connection fails:
+       - Try different VPN server
+       - Check firewall settings
+       - Restart VPN client
+       - Contact IT if issue persists
+    """,
+    
+    "email setup": """
+    **Email Configuration:**
+    1. Open email client (Outlook, Thunderbird, etc.)
+    2. Add new account
+    3. Enter your email address: username@company.com
+    4. Server settings:
+       - IMAP: mail.company.com (port 993)
+       - SMTP: mail.company.com (port 587)
+    5. Use your network password
+    """,
+    
+    "printer setup": """
+    **Printer Installation:**
+    1. Connect printer to network or USB
+    2. Download printer driver from manufacturer website
+    3. Run installer as administrator
+    4. Add printer through Windows Settings
+    5. Test print a page
+    6. If issues, check printer IP address and network connectivity
+    """,
+    
+    "software installation": """
+    **Software Installation Guide:**
+    1. Download software from approved sources
+    2. Run installer as administrator
+    3. Follow installation wizard
+    4. Restart computer if prompted
+    5. Test the application
+    6. Contact IT if installation fails
+    """,
+    
+    "network connectivity": """
+    **Network Troubleshooting:**
+    1. Check physical connections
+    2. Restart network adapter
+    3. Run network troubleshooter
+    4. Check IP configuration
+    5. Test with different network cable
+    6. Contact IT if issue persists
+    """
+}
+
+NO_SOLUTION_MESSAGE = "I don't have a specific solution for this issue in my knowledge base. Let me escalate this to a human team for assistance."
+
+# Most articles returned for one query
+TOP_K = 2
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Article keys are written "<subject> <action>", e.g. "printer setup". The
+# subject says which article a query is about; actions like "setup" or
+# "reset" on their own do not.
+_SUBJECTS: Dict[str, str] = {key.split()[0]: key for key in KNOWLEDGE_BASE}
+
+
+def _build_action_index() -> Dict[str, Tuple[str, ...]]:
+    """Map each action word of an article key to the articles using it."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for key in KNOWLEDGE_BASE:
+        for word in key.split()[1:]:
+            index[word] = index.get(word, ()) + (key,)
+    return index
+
+
+# Action words to articles, built once at import
+_ACTIONS = _build_action_index()
+
+
+@lru_cache(maxsize=1024)
+def _lookup(normalized_query: str) -> Tuple[str, ...]:
+    """Return the most relevant articles for a query given as space-separated lowercase words."""
+    words = set(normalized_query.split())
+    # An article needs its subject in the query; ties keep knowledge base order
+    matches: List[str] = [key for subject, key in _SUBJECTS.items() if subject in words]
+    if not matches:
+        return ()
+    
+    # An action belonging only to articles whose subject is missing means the
+    # query is about something else, as in "reset the printer"
+    for word in words & _ACTIONS.keys():
+        if not any(key in matches for key in _ACTIONS[word]):
+            return ()
+    
+    scores = {key: len(words & set(key.split())) for key in matches}
+    best = max(scores.values())
+    return tuple(KNOWLEDGE_BASE[key] for key in matches if scores[key] == best)[:TOP_K]
 
 
 def search_knowledge_base(query: str, tool_context: ToolContext) -> str:
@@ -14,85 +133,13 @@ def search_knowledge_base(query: str, tool_context: ToolContext) -> str:
     Returns:
         Relevant solution or documentation
     """
-    # Mock knowledge base - in production, this would connect to a real knowledge base
-    knowledge_base = {
-        "password reset": """
-        **Password Reset Process:**
-        1. Go to https://password.company.com
-        2. Enter your username
-        3. Click "Reset Password"
-        4. Check your email for reset link
-        5. Create a new password following security requirements
-        6. Log in with new password
-        
-        **Security Requirements:**
-        - Minimum 8 characters
-        - Include uppercase, lowercase, number, and special character
-        - Cannot reuse last 5 passwords
-        """,
-        
-        "vpn connection": """
-        **VPN Connection Troubleshooting:**
-        1. Check internet connection
-        2. Open VPN client application
-        3. Enter your username and password
-        4. If connection fails:
-           - Try different VPN server
-           - Check firewall settings
-           - Restart VPN client
-           - Contact IT if issue persists
-        """,
-        
-        "email setup": """
-        **Email Configuration:**
-        1. Open email client (Outlook, Thunderbird, etc.)
-        2. Add new account
-        3. Enter your email address: username@company.com
-        4. Server settings:
-           - IMAP: mail.company.com (port 993)
-           - SMTP: mail.company.com (port 587)
-        5. Use your network password
-        """,
-        
-        "printer setup": """
-        **Printer Installation:**
-        1. Connect printer to network or USB
-        2. Download printer driver from manufacturer website
-        3. Run installer as administrator
-        4. Add printer through Windows Settings
-        5. Test print a page
-        6. If issues, check printer IP address and network connectivity
-        """,
-        
-        "software installation": """
-        **Software Installation Guide:**
-        1. Download software from approved sources
-        2. Run installer as administrator
-        3. Follow installation wizard
-        4. Restart computer if prompted
-        5. Test the application
-        6. Contact IT if installation fails
-        """,
-        
-        "network connectivity": """
-        **Network Troubleshooting:**
-        1. Check physical connections
-        2. Restart network adapter
-        3. Run network troubleshooter
-        4. Check IP configuration
-        5. Test with different network cable
-        6. Contact IT if issue persists
-        """
-    }
-    
-    # Simple keyword matching - in production, use semantic search
-    query_lower = query.lower()
-    for key, solution in knowledge_base.items():
-        if key in query_lower:
-            return solution
-    
-    return "I don't have a specific solution for this issue in my knowledge base. Let me escalate this to a human team for assistance."
+    # Case, spacing and punctuation variants of a recurring question share one
+    # cache entry; only the words matter to the lookup
+    solutions = _lookup(" ".join(_WORD_RE.findall(query.lower())))
+    if not solutions:
+        return NO_SOLUTION_MESSAGE
+    return "\n".join(solutions)
 
 
 # The tool is just the function itself
-knowledge_search_tool = search_knowledge_base 
\ No newline at end of file
+knowledge_search_tool = search_knowledge_base
@@ -2,7 +2,8 @@
 
 from google.adk.tools import ToolContext
 from typing import Dict, Any
-from .email_sender import EmailSender
+from .email_sender import email_sender
+from .concurrency import dispatch
 
 def send_solution_notification(
     user_email: str, 
@@ -14,7 +15,6 @@ def send_solution_notification(
     Send solution notification email to user.
     """
     try:
-        email_sender = EmailSender()
         subject = f"IT Support Solution: {problem_description[:50]}..."
         
         # Modern HTML email body
@@ -105,17 +105,17 @@ Best regards,
 AI IT Support Team
         """.strip()
         
-        success = email_sender.send_simple_email(
+        # SMTP takes seconds; send in the background so the agent can reply now.
+        # send_simple_email logs its own failures.
+        dispatch(
+            email_sender.send_simple_email,
             to_email=user_email,
             subject=subject,
             body=body,
             html_body=html_body
         )
         
-        if success:
-            return f"✅ Solution notification sent successfully to {user_email}"
-        else:
-            return f"❌ Failed to send solution notification to {user_email}"
+        return f"✅ Solution notification queued for delivery to {user_email}"
             
     except Exception as e:
         return f"❌ Error sending solution notification: {str(e)}"
@@ -131,7 +131,6 @@ def send_escalation_notification(
     Send escalation notification email to user.
     """
     try:
-        email_sender = EmailSender()
         subject = f"IT Support Escalated: {problem_description[:50]}..."
         
         # Modern HTML email body
@@ -234,17 +233,18 @@ Best regards,
 AI IT Support Team
         """.strip()
         
-        success = email_sender.send_simple_email(
+        # SMTP takes seconds; send in the background so the agent can reply now.
+        # send_simple_email logs its own failures.
+        dispatch(
+            email_sender.send_simple_email,
             to_email=user_email,
             subject=subject,
             body=body,
-            html_body=html_body
+            html_body=html_body,
+            priority=priority.lower()
         )
         
-        if success:
-            return f"✅ Escalation notification sent successfully to {user_email}"
-        else:
-            return f"❌ Failed to send escalation notification to {user_email}"
+        return f"✅ Escalation notification queued for delivery to {user_email}"
             
     except Exception as e:
         return f"❌ Error sending escalation notification: {str(e)}"
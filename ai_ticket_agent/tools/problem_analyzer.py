@@ -2,25 +2,11 @@
 
 from google.adk.tools import ToolContext
 from typing import Dict, Any
+from ai_ticket_agent.taxonomy import DEFAULT_PRIORITY, TEAM_CATEGORIES, match_route, match_triage
+from .email_collector import EMAIL_RE
 
-
-def analyze_problem(problem_description: str, tool_context: ToolContext) -> str:
-    """
-    Provide context and guidance for LLM-based problem analysis.
-    
-    Args:
-        problem_description: The user's IT problem description
-        tool_context: The ADK tool context
-        
-    Returns:
-        Context and guidance for the LLM to analyze the problem
-    """
-    
-    return f"""
-    **Problem Analysis Context:**
-    
-    Problem Description: {problem_description}
-    
+# Static part of the analysis context, built once rather than on every call
+ANALYSIS_GUIDE = """
     **Analysis Guidelines for LLM:**
     
     Consider the following factors when analyzing this IT problem:
@@ -57,5 +43,73 @@ def analyze_problem(problem_description: str, tool_context: ToolContext) -> str:
     """
 
 
+def _known_email(problem_description: str, tool_context: ToolContext) -> bool:
+    """
+    Check whether the user's email is known for this turn.
+    
+    The root agent calls collect_user_email alongside this tool, and a
+    parallel call only sees its sibling's state changes if the sibling ran
+    first, so the email is also looked for in the problem and the user's
+    message directly.
+    """
+    if tool_context.state.get("user_email") or EMAIL_RE.search(problem_description):
+        return True
+    user_content = tool_context.user_content
+    parts = (user_content.parts if user_content else None) or []
+    return any(part.text and EMAIL_RE.search(part.text) for part in parts)
+
+
+def analyze_problem(problem_description: str, tool_context: ToolContext) -> str:
+    """
+    Provide context and guidance for LLM-based problem analysis.
+    
+    Args:
+        problem_description: The user's IT problem description
+        tool_context: The ADK tool context
+        
+    Returns:
+        Context and guidance for the LLM to analyze the problem
+    """
+    
+    # Triage once here; sub-agents get it from session state instead of
+    # re-deriving team, priority and category from the raw problem text
+    team, priority = match_triage(problem_description)
+    triage = {
+        "team": team,
+        "category": TEAM_CATEGORIES[team] if team else None,
+        # Only urgency keywords are worth passing on; medium is just the default
+        "priority": priority if priority != DEFAULT_PRIORITY else None,
+        "route": match_route(team, priority),
+    }
+    if tool_context is not None:
+        tool_context.state["triage"] = triage
+        # Critical tickets always escalate, so once the email is known they are
+        # handed off straight from this tool call. Other routes are only a
+        # hint; the root agent decides with the full problem in view.
+        if priority == "critical" and _known_email(problem_description, tool_context):
+            tool_context.actions.transfer_to_agent = triage["route"]
+    
+    matched = []
+    if team:
+        matched.append(team)
+    if triage["priority"]:
+        matched.append(f"{priority} priority")
+    
+    triage_note = ""
+    if matched:
+        triage_note = f"""
+    **Keyword Triage:** {', '.join(matched)}
+    """
+    if triage["route"]:
+        triage_note += f"""**Keyword Route:** `{triage['route']}` suggested by keywords
+    """
+    
+    return f"""
+    **Problem Analysis Context:**
+    
+    Problem Description: {problem_description}
+    """ + ANALYSIS_GUIDE + triage_note
+
+
 # The tool is just the function itself
 problem_analyzer_tool = analyze_problem 
\ No newline at end of file
@@ -1,10 +1,56 @@
 """Enhanced resolution tracker tool for monitoring self-service success with database persistence."""
 
 from google.adk.tools import ToolContext
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from ai_ticket_agent.database import db_manager
 from ai_ticket_agent.models import ResolutionStatus
 
+# Phrases that mark user feedback as positive, negative or asking for a human.
+# Matched as substrings of the lowercased feedback.
+POSITIVE_INDICATORS = (
+    "worked", "solved", "fixed", "resolved", "yes", "good", "thanks",
+    "thank you", "perfect", "great", "okay", "ok", "fine", "successful",
+    "working", "better", "improved", "helped", "useful"
+)
+
+NEGATIVE_INDICATORS = (
+    "didn't work", "not working", "still broken", "no", "failed",
+    "doesn't work", "can't", "unable", "error", "problem", "issue",
+    "same", "still", "worse", "useless", "didn't help", "not fixed"
+)
+
+ESCALATION_INDICATORS = (
+    "escalate", "human", "support", "team", "expert", "specialist",
+    "complex", "complicated", "urgent", "critical", "emergency"
+)
+
+# Resolution status per feedback analysis label
+FEEDBACK_STATUSES: Dict[str, ResolutionStatus] = {
+    "POSITIVE_FEEDBACK": ResolutionStatus.SUCCESS,
+    "NEGATIVE_FEEDBACK": ResolutionStatus.FAILED,
+    "ESCALATION_REQUESTED": ResolutionStatus.ESCALATED,
+}
+
+# Ticket status, status update message and tool result per resolution
+# outcome. Pending attempts leave the ticket as it is.
+RESOLUTION_OUTCOMES: Dict[ResolutionStatus, Tuple[str, str, str]] = {
+    ResolutionStatus.SUCCESS: (
+        "resolved",
+        "Issue resolved through self-service",
+        "RESOLVED: Ticket {ticket_id} successfully resolved."
+    ),
+    ResolutionStatus.FAILED: (
+        "escalated",
+        "Self-service resolution failed, escalating to human team",
+        "ESCALATION_NEEDED: Ticket {ticket_id} resolution failed. Escalating to human team."
+    ),
+    ResolutionStatus.ESCALATED: (
+        "escalated",
+        "Issue escalated to human team",
+        "ESCALATED: Ticket {ticket_id} escalated to human team."
+    ),
+}
+
 
 def track_resolution_attempt(
     ticket_id: str,
@@ -33,11 +79,6 @@ def track_resolution_attempt(
     session = db_manager.get_session()
     
     try:
-        # Check if ticket exists
-        ticket = db_manager.get_ticket(session, ticket_id)
-        if not ticket:
-            return f"ERROR: Ticket {ticket_id} not found in database"
-        
         # Analyze user feedback if provided
         feedback_analysis = None
         resolution_status = ResolutionStatus.PENDING
@@ -46,50 +87,31 @@ def track_resolution_attempt(
             feedback_analysis = analyze_user_feedback(user_feedback)
             resolution_status = determine_resolution_status(feedback_analysis)
         
-        # Create resolution attempt record
-        resolution_attempt = db_manager.add_resolution_attempt(
-            session=session,
-            ticket_id=ticket_id,
-            agent_type=agent_type,
-            solution_provided=solution_provided,
-            user_feedback=user_feedback,
-            status=resolution_status,
-            feedback_analysis=feedback_analysis
-        )
-        
-        # Update ticket status based on resolution outcome
-        if resolution_status == ResolutionStatus.SUCCESS:
-            db_manager.update_ticket_status(
-                session=session,
-                ticket_id=ticket_id,
-                status="resolved",
-                message="Issue resolved through self-service",
-                updated_by="ai_agent"
-            )
-            return f"RESOLVED: Ticket {ticket_id} successfully resolved. Resolution attempt #{resolution_attempt.attempt_number} recorded."
-        
-        elif resolution_status == ResolutionStatus.FAILED:
-            db_manager.update_ticket_status(
-                session=session,
-                ticket_id=ticket_id,
-                status="escalated",
-                message="Self-service resolution failed, escalating to human team",
-                updated_by="ai_agent"
-            )
-            return f"ESCALATION_NEEDED: Ticket {ticket_id} resolution failed. Escalating to human team. Resolution attempt #{resolution_attempt.attempt_number} recorded."
+        # Pending attempts leave the ticket as it is
+        outcome = RESOLUTION_OUTCOMES.get(resolution_status)
+        ticket_status, message, summary = outcome or (None, None, None)
         
-        elif resolution_status == ResolutionStatus.ESCALATED:
-            db_manager.update_ticket_status(
+        # Record the attempt and any status change in one transaction; the
+        # ticket lookup it does anyway doubles as the existence check
+        try:
+            resolution_attempt = db_manager.add_resolution_attempt(
                 session=session,
                 ticket_id=ticket_id,
-                status="escalated",
-                message="Issue escalated to human team",
-                updated_by="ai_agent"
+                ticket_status=ticket_status,
+                status_message=message,
+                updated_by="ai_agent",
+                agent_type=agent_type,
+                solution_provided=solution_provided,
+                user_feedback=user_feedback,
+                status=resolution_status,
+                feedback_analysis=feedback_analysis
             )
-            return f"ESCALATED: Ticket {ticket_id} escalated to human team. Resolution attempt #{resolution_attempt.attempt_number} recorded."
+        except ValueError:
+            return f"ERROR: Ticket {ticket_id} not found in database"
         
-        else:
+        if outcome is None:
             return f"PENDING: Ticket {ticket_id} resolution attempt #{resolution_attempt.attempt_number} recorded. Awaiting user feedback."
+        return f"{summary.format(ticket_id=ticket_id)} Resolution attempt #{resolution_attempt.attempt_number} recorded."
     
     except Exception as e:
         return f"ERROR: Failed to track resolution attempt for ticket {ticket_id}: {str(e)}"
@@ -110,29 +132,9 @@ def analyze_user_feedback(user_feedback: str) -> str:
     """
     feedback_lower = user_feedback.lower()
     
-    # Check for positive indicators
-    positive_indicators = [
-        "worked", "solved", "fixed", "resolved", "yes", "good", "thanks", 
-        "thank you", "perfect", "great", "okay", "ok", "fine", "successful",
-        "working", "better", "improved", "helped", "useful"
-    ]
-    
-    # Check for negative indicators
-    negative_indicators = [
-        "didn't work", "not working", "still broken", "no", "failed", 
-        "doesn't work", "can't", "unable", "error", "problem", "issue",
-        "same", "still", "worse", "useless", "didn't help", "not fixed"
-    ]
-    
-    # Check for escalation indicators
-    escalation_indicators = [
-        "escalate", "human", "support", "team", "expert", "specialist",
-        "complex", "complicated", "urgent", "critical", "emergency"
-    ]
-    
-    positive_count = sum(1 for indicator in positive_indicators if indicator in feedback_lower)
-    negative_count = sum(1 for indicator in negative_indicators if indicator in feedback_lower)
-    escalation_count = sum(1 for indicator in escalation_indicators if indicator in feedback_lower)
+    positive_count = sum(1 for indicator in POSITIVE_INDICATORS if indicator in feedback_lower)
+    negative_count = sum(1 for indicator in NEGATIVE_INDICATORS if indicator in feedback_lower)
+    escalation_count = sum(1 for indicator in ESCALATION_INDICATORS if indicator in feedback_lower)
     
     if escalation_count > 0:
         return f"ESCALATION_REQUESTED: User explicitly requested escalation or human assistance. Positive indicators: {positive_count}, Negative indicators: {negative_count}, Escalation indicators: {escalation_count}"
@@ -154,14 +156,9 @@ def determine_resolution_status(feedback_analysis: str) -> ResolutionStatus:
     Returns:
         Resolution status
     """
-    if "POSITIVE_FEEDBACK" in feedback_analysis:
-        return ResolutionStatus.SUCCESS
-    elif "NEGATIVE_FEEDBACK" in feedback_analysis:
-        return ResolutionStatus.FAILED
-    elif "ESCALATION_REQUESTED" in feedback_analysis:
-        return ResolutionStatus.ESCALATED
-    else:
-        return ResolutionStatus.PENDING
+    # The analysis starts with its label, e.g. "POSITIVE_FEEDBACK: ..."
+    label = feedback_analysis.split(":", 1)[0]
+    return FEEDBACK_STATUSES.get(label, ResolutionStatus.PENDING)
 
 
 def get_ticket_resolution_history(ticket_id: str) -> str:
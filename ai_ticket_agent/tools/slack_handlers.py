@@ -4,6 +4,8 @@ import os
 import json
 from typing import Dict, Any, Optional
 from google.adk.tools import ToolContext
+from ai_ticket_agent.database import db_manager
+from ai_ticket_agent.taxonomy import CHANNEL_TEAMS, DEFAULT_TEAM, TEAM_CHANNELS, TEAM_KEYWORDS
 
 # Try to import slack_sdk, but don't fail if not available
 try:
@@ -15,6 +17,53 @@ except ImportError:
     print("⚠️  slack_sdk not installed. Slack notifications will be simulated.")
 
 
+# Priority emoji mapping
+PRIORITY_EMOJI = {
+    "critical": "🚨",
+    "high": "⚠️",
+    "medium": "📋",
+    "low": "ℹ️"
+}
+
+# Slack rejects section text longer than this
+MAX_SECTION_TEXT = 3000
+
+# Routing reasons saved with a team assignment, one per keyword-matched team
+TRIAGE_ROUTING_REASONS = {team: f"Keyword triage matched {team}" for team in TEAM_KEYWORDS}
+AGENT_ROUTING_REASON = "Assigned by escalation agent"
+
+# Reply per Slack button action on an escalated ticket
+ACTION_MESSAGES = {
+    "acknowledge_ticket": "✅ Ticket acknowledged by the team",
+    "escalate_further": "🔄 Ticket escalated to senior team member",
+    "mark_resolved": "🎉 Ticket marked as resolved",
+}
+
+# Blocks that are the same on every escalation message
+_NEXT_STEPS_BLOCK = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Next Steps:*\n• Please acknowledge this ticket\n• Update status in the thread\n• Contact user when resolved"
+    }
+}
+
+_FOOTER_BLOCKS = [
+    {
+        "type": "divider"
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "🤖 *Automatically escalated by AI Support Agent*"
+            }
+        ]
+    }
+]
+
+
 def get_slack_client() -> Optional[WebClient]:
     """Get Slack client if credentials are available."""
     if not SLACK_AVAILABLE:
@@ -29,17 +78,7 @@ def get_slack_client() -> Optional[WebClient]:
 
 def get_team_channel(team_name: str) -> str:
     """Map team names to Slack channels."""
-    team_channel_map = {
-        "Network Team": "#it-network-support",
-        "Security Team": "#it-security-support", 
-        "Hardware Team": "#it-hardware-support",
-        "Software Team": "#it-software-support",
-        "Access Management": "#it-access-support",
-        "Infrastructure Team": "#it-infrastructure-support",
-        "General IT Support": "#it-general-support"
-    }
-    
-    return team_channel_map.get(team_name, "#it-general-support")
+    return TEAM_CHANNELS.get(team_name, TEAM_CHANNELS[DEFAULT_TEAM])
 
 
 def get_fallback_channel() -> str:
@@ -52,73 +91,58 @@ def get_fallback_channel() -> str:
     return "#it-general-support"
 
 
-def format_slack_message(team_name: str, problem_description: str, user_email: str, priority: str = "medium") -> Dict[str, Any]:
+def format_slack_message(team_name: str, problem_description: str, user_email: str, priority: str = "medium", ticket_id: Optional[str] = None) -> Dict[str, Any]:
     """Format a Slack message for team escalation."""
     
-    # Priority emoji mapping
-    priority_emoji = {
-        "critical": "🚨",
-        "high": "⚠️", 
-        "medium": "📋",
-        "low": "ℹ️"
-    }
+    emoji = PRIORITY_EMOJI.get(priority.lower(), "📋")
+    title = f"{emoji} IT Support Ticket - {team_name}"
+    
+    fields = [
+        {
+            "type": "mrkdwn",
+            "text": f"*User:*\n{user_email}"
+        },
+        {
+            "type": "mrkdwn", 
+            "text": f"*Priority:*\n{priority.upper()}"
+        }
+    ]
+    if ticket_id:
+        fields.append({
+            "type": "mrkdwn",
+            "text": f"*Ticket:*\n{ticket_id}"
+        })
     
-    emoji = priority_emoji.get(priority.lower(), "📋")
+    description = f"*Problem Description:*\n{problem_description}"
+    if len(description) > MAX_SECTION_TEXT:
+        description = description[:MAX_SECTION_TEXT - 1] + "…"
     
-    # Format the message
-    message = {
-        "text": f"{emoji} IT Support Ticket - {team_name}",
+    # Only the header, fields and description vary per ticket
+    return {
+        "text": title,
         "blocks": [
             {
                 "type": "header",
                 "text": {
                     "type": "plain_text",
-                    "text": f"{emoji} IT Support Ticket - {team_name}"
+                    "text": title
                 }
             },
             {
                 "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*User:*\n{user_email}"
-                    },
-                    {
-                        "type": "mrkdwn", 
-                        "text": f"*Priority:*\n{priority.upper()}"
-                    }
-                ]
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Problem Description:*\n{problem_description}"
-                }
+                "fields": fields
             },
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": "*Next Steps:*\n• Please acknowledge this ticket\n• Update status in the thread\n• Contact user when resolved"
+                    "text": description
                 }
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🤖 *Automatically escalated by AI Support Agent*"
-                    }
-                ]
-            }
+            _NEXT_STEPS_BLOCK,
+            *_FOOTER_BLOCKS
         ]
     }
-    
-    return message
 
 
 def send_slack_notification(channel: str, message: Dict[str, Any]) -> Dict[str, Any]:
@@ -195,46 +219,103 @@ def send_slack_notification(channel: str, message: Dict[str, Any]) -> Dict[str,
         }
 
 
-def escalate_to_slack(team_assignment: str, problem_description: str, user_email: str = "Unknown User", priority: str = "medium", tool_context: ToolContext = None) -> str:
+def escalate_to_slack(team_assignment: str = "", problem_description: str = "", user_email: str = "Unknown User", priority: str = "medium", ticket_id: str = "", tool_context: ToolContext = None) -> str:
     """
     Format and send ticket to appropriate Slack channel.
     
+    When a ticket ID is given, the message is built from the ticket's current
+    database record, and the team argument is only needed if the ticket has
+    no assigned team yet. After a successful post the ticket is marked
+    escalated, with its team, Slack location and a team assignment record
+    saved in the same transaction. If that save fails, the result says so
+    instead of reporting a complete escalation.
+    
     Args:
         team_assignment: Team routing information (e.g., "Software Team")
         problem_description: The IT problem description
         user_email: User's email address
         priority: Priority level (critical, high, medium, low)
+        ticket_id: ID of the ticket to escalate
         tool_context: The ADK tool context
         
     Returns:
         Confirmation of escalation
     """
     
+    if ticket_id:
+        session = db_manager.get_session()
+        try:
+            ticket = db_manager.get_ticket(session, ticket_id)
+            if not ticket:
+                return f"ERROR: Ticket {ticket_id} not found"
+            team_assignment = team_assignment or ticket.assigned_team
+            problem_description = ticket.description
+            user_email = ticket.user_email
+            priority = ticket.priority.value
+        finally:
+            session.close()
+
+    if not problem_description:
+        return "ERROR: Provide a ticket_id or a problem_description to escalate"
+
+    if not team_assignment:
+        team_assignment = DEFAULT_TEAM
+    
     # Extract team name from assignment
     team_name = team_assignment
     if "#it-" in team_assignment:
         # Extract team name from channel format
         channel_part = team_assignment.split("#it-")[1].split("-")[0]
-        team_name_map = {
-            "network": "Network Team",
-            "security": "Security Team", 
-            "hardware": "Hardware Team",
-            "software": "Software Team",
-            "access": "Access Management",
-            "infrastructure": "Infrastructure Team",
-            "general": "General IT Support"
-        }
-        team_name = team_name_map.get(channel_part, "General IT Support")
+        team_name = CHANNEL_TEAMS.get(channel_part, DEFAULT_TEAM)
     
     # Get the appropriate channel
     channel = get_team_channel(team_name)
     
     # Format the Slack message
-    slack_message = format_slack_message(team_name, problem_description, user_email, priority)
+    slack_message = format_slack_message(team_name, problem_description, user_email, priority, ticket_id or None)
     
     # Send the notification
     result = send_slack_notification(channel, slack_message)
     
+    if ticket_id and result["success"]:
+        # Save the escalation outcome so no separate update call is needed.
+        # The routing reason is recorded from triage, not from model narration.
+        triage = (tool_context.state.get("triage") if tool_context is not None else None) or {}
+        if triage.get("team") == team_name:
+            routing_reason = TRIAGE_ROUTING_REASONS[team_name]
+        else:
+            routing_reason = AGENT_ROUTING_REASON
+        session = db_manager.get_session()
+        try:
+            saved = db_manager.record_escalation(
+                session,
+                ticket_id,
+                team_name,
+                result.get("channel", channel),
+                slack_message_ts=result.get("ts"),
+                routing_reason=routing_reason
+            )
+            save_error = None if saved else f"Ticket {ticket_id} not found"
+        except Exception as e:
+            session.rollback()
+            save_error = str(e)
+        finally:
+            session.close()
+        
+        if save_error:
+            # The message is already out, so report the post and the failed
+            # save together rather than asking for a second escalation
+            return f"""
+**Slack Escalation Sent, Ticket Not Updated** ⚠️
+
+Team: {team_name}
+Channel: {result.get('channel', channel)}
+Message ID: {result.get('ts', 'N/A')}
+Error: {save_error}
+
+The Slack step succeeded, but the escalation could not be saved to ticket {ticket_id}. Record it with `update_ticket` (status escalated, team {team_name}) instead of escalating again.
+            """
+    
     if result["success"]:
         if result.get("simulated"):
             return f"""
@@ -291,14 +372,9 @@ def handle_slack_interaction(payload: Dict[str, Any]) -> Dict[str, Any]:
             # Handle button clicks
             actions = payload.get("actions", [])
             for action in actions:
-                action_id = action.get("action_id")
-                
-                if action_id == "acknowledge_ticket":
-                    return {"message": "✅ Ticket acknowledged by the team"}
-                elif action_id == "escalate_further":
-                    return {"message": "🔄 Ticket escalated to senior team member"}
-                elif action_id == "mark_resolved":
-                    return {"message": "🎉 Ticket marked as resolved"}
+                message = ACTION_MESSAGES.get(action.get("action_id"))
+                if message:
+                    return {"message": message}
         
         elif interaction_type == "view_submission":
             # Handle modal submissions
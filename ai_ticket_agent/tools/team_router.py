@@ -2,38 +2,10 @@
 
 from google.adk.tools import ToolContext
 from typing import Dict, Any
+from ai_ticket_agent.taxonomy import PRIORITY_SLAS, TEAM_CATEGORIES, TEAM_CHANNELS, TEAM_KEYWORDS, match_triage
 
-
-def route_to_team(problem_description: str, priority: str = "medium", tool_context: ToolContext = None) -> str:
-    """
-    Provide context and guidance for LLM-based team routing.
-    
-    Args:
-        problem_description: The IT problem description
-        priority: Priority level (critical, high, medium, low)
-        tool_context: The ADK tool context
-        
-    Returns:
-        Context and guidance for the LLM to assign teams
-    """
-    
-    # Priority-based SLA mapping
-    sla_map = {
-        "critical": "1 hour",
-        "high": "4 hours", 
-        "medium": "8 hours",
-        "low": "24 hours"
-    }
-    
-    sla = sla_map.get(priority.lower(), "8 hours")
-    
-    return f"""
-    **Team Routing Context:**
-    
-    Problem Description: {problem_description}
-    Priority: {priority.upper()}
-    SLA: {sla}
-    
+# Static part of the routing context, built once rather than on every call
+TEAM_GUIDE = """
     **Available Teams and Their Expertise:**
     
     1. **Network Team** (#it-network-support)
@@ -86,9 +58,59 @@ def route_to_team(problem_description: str, priority: str = "medium", tool_conte
     - **Access Management**: Account creation, permissions, user provisioning, identity management
     - **General IT Support**: Multiple unrelated issues, general troubleshooting, non-technical users
     
-    **Your Task:** Analyze the problem and assign it to the most appropriate team based on the problem description and team expertise. Provide your reasoning for the assignment.
+    **Your Task:** Analyze the problem and assign it to the most appropriate team based on the problem description and team expertise.
     """
 
+# Assignment part of a keyword-matched routing result, per team
+ASSIGNMENT_BLOCKS = {
+    team: f"""
+    Assigned Team: **{team}** ({TEAM_CHANNELS[team]})
+    Ticket Category: {TEAM_CATEGORIES[team]}
+    Reason: The problem description clearly matches this team's expertise.
+    
+    **Your Task:** Use this team assignment unless the user has told you something that clearly contradicts it.
+    """
+    for team in TEAM_KEYWORDS
+}
+
+
+def route_to_team(problem_description: str, priority: str = "medium", tool_context: ToolContext = None) -> str:
+    """
+    Provide context and guidance for LLM-based team routing.
+    
+    Args:
+        problem_description: The IT problem description
+        priority: Priority level (critical, high, medium, low)
+        tool_context: The ADK tool context
+        
+    Returns:
+        Context and guidance for the LLM to assign teams
+    """
+    
+    sla = PRIORITY_SLAS.get(priority.lower(), PRIORITY_SLAS["medium"])
+    
+    # Clear keyword matches skip the full team listing below
+    team, suggested_priority = match_triage(problem_description)
+    if team:
+        priority_note = ""
+        if suggested_priority != priority.lower() and suggested_priority != "medium":
+            priority_note = f"\n    Suggested Priority: {suggested_priority.upper()} (SLA: {PRIORITY_SLAS[suggested_priority]})"
+        return f"""
+    **Team Routing Result:**
+    
+    Problem Description: {problem_description}
+    Priority: {priority.upper()}
+    SLA: {sla}{priority_note}
+    """ + ASSIGNMENT_BLOCKS[team]
+    
+    return f"""
+    **Team Routing Context:**
+    
+    Problem Description: {problem_description}
+    Priority: {priority.upper()}
+    SLA: {sla}
+    """ + TEAM_GUIDE
+
 
 # The tool is just the function itself
 team_router_tool = route_to_team 
\ No newline at end of file
@@ -3,7 +3,7 @@
 from google.adk.tools import ToolContext
 from typing import Dict, Any, Optional
 from ai_ticket_agent.database import db_manager
-from ai_ticket_agent.models import TicketStatus, TicketPriority, TicketCategory
+from ai_ticket_agent.models import TicketStatus, status_from, priority_from, category_from
 
 
 def create_ticket(
@@ -34,7 +34,7 @@ def create_ticket(
     try:
         # Validate priority
         try:
-            priority_enum = TicketPriority(priority.lower())
+            priority_enum = priority_from(priority.lower())
         except ValueError:
             return f"ERROR: Invalid priority '{priority}'. Valid options: low, medium, high, critical"
         
@@ -42,11 +42,11 @@ def create_ticket(
         category_enum = None
         if category:
             try:
-                category_enum = TicketCategory(category.lower())
+                category_enum = category_from(category.lower())
             except ValueError:
                 return f"ERROR: Invalid category '{category}'. Valid options: software, hardware, network, security, access, infrastructure, general"
         
-        # Create ticket
+        # Create ticket and its initial status event in one transaction
         ticket = db_manager.create_ticket(
             session=session,
             subject=subject,
@@ -54,16 +54,8 @@ def create_ticket(
             user_email=user_email,
             priority=priority_enum,
             category=category_enum,
-            status=TicketStatus.OPEN
-        )
-        
-        # Create initial status update
-        db_manager.update_ticket_status(
-            session=session,
-            ticket_id=ticket.ticket_id,
-            status="open",
-            message="Ticket created",
-            updated_by="ai_agent"
+            status=TicketStatus.OPEN,
+            status_message="Ticket created"
         )
         
         return f"""
@@ -125,13 +117,13 @@ def update_ticket(
         # Update fields if provided
         if status:
             try:
-                ticket.status = TicketStatus(status.lower())
+                ticket.status = status_from(status.lower())
             except ValueError:
                 return f"ERROR: Invalid status '{status}'. Valid options: open, in_progress, resolved, closed, escalated"
         
         if priority:
             try:
-                ticket.priority = TicketPriority(priority.lower())
+                ticket.priority = priority_from(priority.lower())
             except ValueError:
                 return f"ERROR: Invalid priority '{priority}'. Valid options: low, medium, high, critical"
         
@@ -155,6 +147,7 @@ def update_ticket(
             )
         else:
             session.commit()
+            db_manager.invalidate(ticket_id)
         
         return f"""
 **Ticket Updated Successfully** ✅
@@ -243,18 +236,21 @@ def search_tickets(
     assigned_team: Optional[str] = None,
     user_email: Optional[str] = None,
     limit: int = 10,
+    offset: int = 0,
     tool_context: Optional[ToolContext] = None
 ) -> str:
     """
     Search for tickets with various filters.
     
     Args:
-        status: Filter by status
+        status: Filter by status, or several comma-separated statuses
+            (e.g. "open,in_progress")
         priority: Filter by priority
         category: Filter by category
         assigned_team: Filter by assigned team
         user_email: Filter by user email
-        limit: Maximum number of results
+        limit: Maximum number of results (capped at 500)
+        offset: Number of results to skip, for paging through results
         tool_context: The ADK tool context
         
     Returns:
@@ -267,7 +263,8 @@ def search_tickets(
         # Build filters
         filters = {}
         if status:
-            filters['status'] = status
+            statuses = [s.strip() for s in status.split(",") if s.strip()]
+            filters['status'] = statuses if len(statuses) > 1 else status.strip()
         if priority:
             filters['priority'] = priority
         if category:
@@ -278,6 +275,7 @@ def search_tickets(
             filters['user_email'] = user_email
         
         filters['limit'] = limit
+        filters['offset'] = offset
         
         # Search tickets
         tickets = db_manager.search_tickets(session, **filters)
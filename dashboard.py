@@ -452,7 +452,7 @@ def settings():
         st.success("✅ Database connection successful")
         
         # Database stats
-        total_tickets = len(db_manager.search_tickets(session, limit=10000))
+        total_tickets = db_manager.metrics_counts(session)["total"]
         st.metric("Total Tickets in Database", total_tickets)
         
     except Exception as e:
@@ -497,15 +497,17 @@ def main():
     st.sidebar.subheader("Quick Stats")
     
     try:
-        df, _ = load_data()
-        if not df.empty:
-            open_count = len(df[df['status'] == 'open'])
-            resolved_count = len(df[df['status'] == 'resolved'])
-            escalated_count = len(df[df['status'] == 'escalated'])
+        session = db_manager.get_session()
+        try:
+            counts = db_manager.metrics_counts(session)
+        finally:
+            session.close()
+        if counts["total"]:
+            status_counts = counts["status"]
             
-            st.sidebar.metric("Open", open_count)
-            st.sidebar.metric("Resolved", resolved_count)
-            st.sidebar.metric("Escalated", escalated_count)
+            st.sidebar.metric("Open", status_counts.get('open', 0))
+            st.sidebar.metric("Resolved", status_counts.get('resolved', 0))
+            st.sidebar.metric("Escalated", status_counts.get('escalated', 0))
     except:
         pass
     
@@ -85,6 +85,12 @@ def run_dashboard():
     subprocess.run([sys.executable, "-m", "streamlit", "run", "dashboard.py"])
 
 
+def run_sla_monitor():
+    """Run the SLA monitor."""
+    print("⏱️  Starting SLA monitor...")
+    subprocess.run([sys.executable, "-m", "ai_ticket_agent.sla"])
+
+
 def show_status():
     """Show system status and configuration."""
     print("📊 AI Ticket Agent System Status")
@@ -124,6 +130,7 @@ def show_status():
     print("  python run.py status        - Show system status")
     print("  python run.py init-db       - Initialize database")
     print("  python run.py dashboard     - Start Streamlit dashboard")
+    print("  python run.py sla-monitor   - Send SLA alerts for open tickets")
 
 
 def main():
@@ -141,7 +148,7 @@ Examples:
     
     parser.add_argument(
         "mode",
-        choices=["web", "cli", "test", "status", "init-db", "dashboard"],
+        choices=["web", "cli", "test", "status", "init-db", "dashboard", "sla-monitor"],
         help="Mode to run the system in"
     )
     
@@ -167,6 +174,8 @@ Examples:
         init_db()
     elif args.mode == "dashboard":
         run_dashboard()
+    elif args.mode == "sla-monitor":
+        run_sla_monitor()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test background dispatch of blocking side effects."""
+
+import sys
+import os
+import logging
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.tools import concurrency
+
+
+def _fail():
+    raise RuntimeError("smtp down")
+
+
+def test_dispatch_logs_background_failures(caplog):
+    """A failed background call is logged with its traceback."""
+    with caplog.at_level(logging.ERROR, logger=concurrency.__name__):
+        future = concurrency.dispatch(_fail)
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+
+    record = next(r for r in caplog.records if r.name == concurrency.__name__)
+    assert "_fail" in record.getMessage()
+    assert record.exc_info is not None
+
+
+def test_dispatch_runs_inline_when_backlogged(monkeypatch):
+    """Past MAX_PENDING waiting calls, dispatch runs the call before returning."""
+    monkeypatch.setattr(concurrency, "MAX_PENDING", 0)
+    future = concurrency.dispatch(sum, (1, 2, 3))
+    assert future.done() and future.result() == 6
+
+
+def test_backlogged_dispatch_does_not_block_event_loop(monkeypatch):
+    """From a running loop, a backlogged call runs off the loop thread."""
+    import asyncio
+    import threading
+
+    monkeypatch.setattr(concurrency, "MAX_PENDING", 0)
+    release = threading.Event()
+
+    async def dispatch_from_loop():
+        future = concurrency.dispatch(release.wait, 5)
+        # The loop is still free while the call waits
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.wrap_future(future)
+
+    assert asyncio.run(dispatch_from_loop()) is True
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Test database manager queries against a scratch SQLite database."""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.database import DatabaseManager
+from ai_ticket_agent.models import Base
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A DatabaseManager on its own empty database file."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'tickets.db'}")
+    Base.metadata.create_all(bind=manager.engine)
+    return manager
+
+
+def _create(manager, session, subject="Printer offline"):
+    """Create a ticket with the fields every test needs."""
+    return manager.create_ticket(
+        session,
+        subject=subject,
+        description="The office printer shows as offline",
+        user_email="user@company.com",
+        status_message="Ticket created"
+    )
+
+
+def test_create_ticket_records_first_status(manager):
+    """The first status update uses the default status when none is given."""
+    session = manager.get_session()
+    try:
+        ticket = _create(manager, session)
+        assert ticket.status.value == "open"
+        assert [update.status.value for update in ticket.status_updates] == ["open"]
+    finally:
+        session.close()
+
+
+def test_search_tickets_clamps_paging(manager):
+    """Out-of-range limits and offsets from the model cannot widen a search."""
+    session = manager.get_session()
+    try:
+        for i in range(3):
+            _create(manager, session, subject=f"Ticket {i}")
+        
+        assert len(manager.search_tickets(session, limit=-1)) == 1
+        assert len(manager.search_tickets(session, limit=0)) == 3
+        assert len(manager.search_tickets(session, limit=None, offset=None)) == 3
+        assert len(manager.search_tickets(session, limit=2, offset=-5)) == 2
+    finally:
+        session.close()
+
+
+def test_cached_reads_follow_writes(manager):
+    """History and metrics served from the read cache reflect every write at once."""
+    session = manager.get_session()
+    try:
+        assert manager.metrics_counts(session)["total"] == 0
+        
+        ticket = _create(manager, session)
+        ticket_id = ticket.ticket_id
+        history = manager.get_ticket_history(session, ticket_id)
+        assert manager.metrics_counts(session)["status"] == {"open": 1}
+        # A repeat read is served from the cache
+        assert manager.get_ticket_history(session, ticket_id) is history
+        
+        manager.create_ticket(session, subject="Second", description="d", user_email="other@company.com")
+        assert manager.metrics_counts(session)["total"] == 2
+        
+        assert manager.update_ticket_status(session, ticket_id, "in_progress", message="Looking into it")
+        history = manager.get_ticket_history(session, ticket_id)
+        assert history["ticket"]["status"] == "in_progress"
+        assert [update["status"] for update in history["status_updates"]] == ["open", "in_progress"]
+        assert manager.metrics_counts(session)["status"] == {"open": 1, "in_progress": 1}
+        
+        manager.add_resolution_attempt(
+            session, ticket_id,
+            agent_type="self_service",
+            solution_provided="Restart the printer"
+        )
+        history = manager.get_ticket_history(session, ticket_id)
+        assert [attempt["attempt_number"] for attempt in history["resolution_attempts"]] == [1]
+        
+        manager.add_resolution_attempt(
+            session, ticket_id,
+            ticket_status="resolved",
+            status_message="Issue resolved through self-service",
+            agent_type="self_service",
+            solution_provided="Reinstall the driver"
+        )
+        history = manager.get_ticket_history(session, ticket_id)
+        assert history["ticket"]["status"] == "resolved"
+        assert len(history["resolution_attempts"]) == 2
+        assert manager.metrics_counts(session)["status"] == {"open": 1, "resolved": 1}
+        
+        assert manager.record_escalation(session, ticket_id, "Hardware Team", "#it-hardware-support", slack_message_ts="123.456")
+        history = manager.get_ticket_history(session, ticket_id)
+        assert history["ticket"]["status"] == "escalated"
+        assert history["ticket"]["assigned_team"] == "Hardware Team"
+        counts = manager.metrics_counts(session)
+        assert counts["status"] == {"open": 1, "escalated": 1}
+        assert counts["assigned_team"]["Hardware Team"] == 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
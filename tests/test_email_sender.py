@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Test SMTP connection reuse in the email sender."""
+
+import sys
+import os
+import smtplib
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.tools import email_sender as email_sender_module
+
+
+class FakeSMTP:
+    """SMTP stand-in whose first connection has been idled out by the server."""
+
+    connections = []
+
+    def __init__(self, host, port):
+        self.sent = []
+        self.closed = False
+        self.stale = not FakeSMTP.connections
+        FakeSMTP.connections.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def send_message(self, msg):
+        if self.stale:
+            raise smtplib.SMTPSenderRefused(421, b"4.4.2 Timeout - closing connection", msg["From"])
+        self.sent.append(msg)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_send_retries_after_421(monkeypatch):
+    """A 421 from an idled-out connection reconnects and sends once more."""
+    monkeypatch.setenv("SMTP_USERNAME", "support@company.com")
+    monkeypatch.setenv("SMTP_PASSWORD", "secret")
+    monkeypatch.setattr(email_sender_module.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(FakeSMTP, "connections", [])
+
+    sender = email_sender_module.EmailSender()
+    assert sender.send_simple_email("user@company.com", "Your ticket", "Body")
+
+    stale, fresh = FakeSMTP.connections
+    assert stale.closed and not stale.sent
+    assert [msg["To"] for msg in fresh.sent] == ["user@company.com"]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__]))
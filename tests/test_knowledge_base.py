@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test knowledge base retrieval."""
+
+import sys
+import os
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.tools.knowledge_base import NO_SOLUTION_MESSAGE, _lookup, search_knowledge_base
+
+
+def test_search_knowledge_base():
+    """Queries get the articles sharing the most key words with them."""
+    assert "VPN Connection Troubleshooting" in search_knowledge_base("My VPN won't connect", None)
+    assert "Password Reset Process" in search_knowledge_base("I forgot my PASSWORD", None)
+
+    printer = search_knowledge_base("how do I setup my printer", None)
+    assert "Printer Installation" in printer
+    assert "Email Configuration" not in printer
+
+    both = search_knowledge_base("vpn connection and network connectivity", None)
+    assert "VPN Connection Troubleshooting" in both
+    assert "Network Troubleshooting" in both
+
+    assert search_knowledge_base("my laptop screen is cracked", None) == NO_SOLUTION_MESSAGE
+    # A word shared by several articles is not enough on its own
+    assert search_knowledge_base("new laptop setup", None) == NO_SOLUTION_MESSAGE
+
+
+def test_generic_words_alone_do_not_match():
+    """An action word without its article's subject does not pick that article."""
+    for query in (
+        "How do I reset my modem?",
+        "My internet connection keeps dropping",
+        "reset the printer",
+        "installation of the new badge reader failed",
+    ):
+        assert search_knowledge_base(query, None) == NO_SOLUTION_MESSAGE, query
+
+
+def test_search_variants_share_cache_entry():
+    """Case, spacing and punctuation variants reuse one cached lookup."""
+    search_knowledge_base("Printer setup?", None)
+    hits = _lookup.cache_info().hits
+    search_knowledge_base("  printer   SETUP!! ", None)
+    assert _lookup.cache_info().hits == hits + 1
+
+
+if __name__ == "__main__":
+    test_search_knowledge_base()
+    test_generic_words_alone_do_not_match()
+    test_search_variants_share_cache_entry()
+    print("✅ Knowledge base tests passed")
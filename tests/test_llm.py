@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test the concurrency cap on shared Gemini model calls."""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from google.adk.models import Gemini, LlmRequest, LlmResponse
+
+from ai_ticket_agent import llm
+
+
+async def _fake_upstream(self, llm_request, stream=False):
+    """Stand-in for the Gemini API that answers without a network call."""
+    await asyncio.sleep(0)
+    yield LlmResponse()
+
+
+def test_nested_model_call_does_not_deadlock(monkeypatch):
+    """A model call made while the caller is paused on a response still runs at limit 1."""
+    monkeypatch.setattr(Gemini, "generate_content_async", _fake_upstream)
+    monkeypatch.setattr(llm, "MAX_INFLIGHT_MODEL_CALLS", 1)
+    model = llm.BoundedGemini(model=llm.MODEL_NAME)
+
+    async def nested_call():
+        async for _ in model.generate_content_async(LlmRequest()):
+            # ADK runs tools and sub-agents here, while the outer call is paused
+            async for inner in model.generate_content_async(LlmRequest()):
+                return inner
+
+    assert asyncio.run(asyncio.wait_for(nested_call(), timeout=5)) is not None
+
+
+def test_nested_streaming_call_does_not_deadlock(monkeypatch):
+    """Streamed responses release the slot between chunks."""
+    monkeypatch.setattr(Gemini, "generate_content_async", _fake_upstream)
+    monkeypatch.setattr(llm, "MAX_INFLIGHT_MODEL_CALLS", 1)
+    model = llm.BoundedGemini(model=llm.MODEL_NAME)
+
+    async def nested_call():
+        async for _ in model.generate_content_async(LlmRequest(), stream=True):
+            async for inner in model.generate_content_async(LlmRequest(), stream=True):
+                return inner
+
+    assert asyncio.run(asyncio.wait_for(nested_call(), timeout=5)) is not None
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__]))
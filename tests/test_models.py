@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Test ticket enum lookups."""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.models import (
+    TicketCategory, TicketPriority, TicketStatus,
+    category_from, priority_from, status_from
+)
+
+
+def test_enum_lookups_accept_values_and_members():
+    """Values map to their members, and members pass through unchanged."""
+    assert status_from("in_progress") is TicketStatus.IN_PROGRESS
+    assert status_from(TicketStatus.ESCALATED) is TicketStatus.ESCALATED
+    assert priority_from("high") is TicketPriority.HIGH
+    assert priority_from(TicketPriority.CRITICAL) is TicketPriority.CRITICAL
+    assert category_from("network") is TicketCategory.NETWORK
+    assert category_from(TicketCategory.HARDWARE) is TicketCategory.HARDWARE
+
+
+def test_enum_lookups_reject_unknown_values():
+    """Unknown values raise ValueError, as the enum constructors do."""
+    with pytest.raises(ValueError):
+        status_from("closed-ish")
+    with pytest.raises(ValueError):
+        priority_from(TicketStatus.OPEN)
+
+
+if __name__ == "__main__":
+    test_enum_lookups_accept_values_and_members()
+    test_enum_lookups_reject_unknown_values()
+    print("✅ Model tests passed")
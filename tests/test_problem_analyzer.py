@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test problem analysis and keyword routing from the root agent's tools."""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.flows.llm_flows.functions import handle_function_calls_async
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from ai_ticket_agent.agent import root_agent
+
+
+async def _run_root_tools_together(message: str, analyze_first: bool = False) -> Event:
+    """Run collect_user_email and analyze_problem as one parallel model step."""
+    service = InMemorySessionService()
+    session = await service.create_session(app_name="ai_ticket_agent", user_id="user")
+    user_content = types.Content(role="user", parts=[types.Part(text=message)])
+    context = InvocationContext(
+        session_service=service,
+        invocation_id="test-invocation",
+        agent=root_agent,
+        session=session,
+        user_content=user_content,
+    )
+    calls = [
+        types.Part(function_call=types.FunctionCall(
+            id="call-email", name="collect_user_email", args={"user_message": message}
+        )),
+        types.Part(function_call=types.FunctionCall(
+            id="call-analyze", name="analyze_problem", args={"problem_description": "Ransomware outage on the file server"}
+        )),
+    ]
+    call_event = Event(
+        invocation_id="test-invocation",
+        author=root_agent.name,
+        content=types.Content(role="model", parts=calls[::-1] if analyze_first else calls),
+    )
+    tools = {tool.name: tool for tool in root_agent.tools}
+    return await handle_function_calls_async(context, call_event, tools)
+
+
+def test_critical_ticket_routes_in_the_email_turn():
+    """A critical ticket transfers even when its email arrives in the same parallel step."""
+    # Sibling calls only see each other's state writes if they happen to run
+    # first, so check both call orders
+    for analyze_first in (False, True):
+        event = asyncio.run(_run_root_tools_together(
+            "Ransomware outage on the file server! I'm jane.doe@company.com",
+            analyze_first=analyze_first
+        ))
+        assert event.actions.state_delta["user_email"] == "jane.doe@company.com"
+        assert event.actions.transfer_to_agent == "escalation_agent"
+
+
+def test_critical_ticket_waits_for_missing_email():
+    """Without an email the root agent asks for it before any transfer."""
+    event = asyncio.run(_run_root_tools_together("Ransomware outage on the file server!"))
+    assert "user_email" not in event.actions.state_delta
+    assert event.actions.transfer_to_agent is None
+
+
+if __name__ == "__main__":
+    test_critical_ticket_routes_in_the_email_turn()
+    test_critical_ticket_waits_for_missing_email()
+    print("✅ Problem analyzer tests passed")
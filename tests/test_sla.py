@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Test SLA timers for open tickets."""
+
+import sys
+import os
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.sla import MAX_DIGEST_TEXT, SLATimers, TrackedTicket, alert_digests, format_alert
+
+HOUR = 3600
+
+
+def test_marks_fire_in_order():
+    """A high priority ticket alerts at 80%, 90% and 100% of its 4 hour SLA."""
+    timers = SLATimers()
+    timers.schedule(TrackedTicket("TICKET-1", "high", created_at=0.0, team="Network Team"), now=0.0)
+
+    assert timers.next_deadline() == 0.8 * 4 * HOUR
+    assert timers.pop_due(now=HOUR) == []
+
+    levels = [alert.level for alert in timers.pop_due(now=4 * HOUR)]
+    assert levels == ["warning", "critical", "breach"]
+    assert timers.next_deadline() is None
+
+
+def test_late_start_raises_one_alert():
+    """Marks already passed when tracking starts collapse into the most severe."""
+    timers = SLATimers()
+    timers.schedule(TrackedTicket("TICKET-2", "critical", created_at=0.0), now=0.95 * HOUR)
+
+    alerts = timers.pop_due(now=0.95 * HOUR)
+    assert [alert.level for alert in alerts] == ["critical"]
+    assert [alert.level for alert in timers.pop_due(now=HOUR)] == ["breach"]
+
+
+def test_resync_drops_closed_and_reschedules_priority_changes():
+    """Closed tickets stop alerting and a priority change restarts the timers."""
+    timers = SLATimers()
+    timers.resync([
+        TrackedTicket("TICKET-3", "low", created_at=0.0),
+        TrackedTicket("TICKET-4", "medium", created_at=0.0),
+    ], now=0.0)
+
+    # TICKET-3 closed, TICKET-4 raised to critical
+    timers.resync([TrackedTicket("TICKET-4", "critical", created_at=0.0)], now=0.0)
+    assert len(timers) == 1
+
+    alerts = timers.pop_due(now=24 * HOUR)
+    assert {alert.ticket_id for alert in alerts} == {"TICKET-4"}
+    assert all(alert.priority == "critical" for alert in alerts)
+
+    # Resyncing an unchanged ticket does not fire its marks again
+    timers.resync([TrackedTicket("TICKET-4", "critical", created_at=0.0)], now=24 * HOUR)
+    assert timers.pop_due(now=48 * HOUR) == []
+
+
+def test_format_alert():
+    """Alert messages name the ticket, priority and SLA window."""
+    timers = SLATimers()
+    timers.schedule(TrackedTicket("TICKET-5", "medium", created_at=0.0), now=9 * HOUR)
+    message = format_alert(timers.pop_due(now=9 * HOUR)[0])
+    assert "TICKET-5" in message
+    assert "MEDIUM" in message
+    assert "8 hours" in message
+
+
+def test_alert_digests_group_by_channel():
+    """Alerts due together share one message per team channel."""
+    timers = SLATimers()
+    timers.resync([
+        TrackedTicket(f"TICKET-{n}", "critical", created_at=0.0, team="Network Team")
+        for n in range(100)
+    ] + [TrackedTicket("TICKET-X", "critical", created_at=0.0)], now=2 * HOUR)
+
+    digests = alert_digests(timers.pop_due(now=2 * HOUR))
+    assert len(digests["#it-general-support"]) == 1
+    network = digests["#it-network-support"]
+    assert len(network) > 1
+    assert all(len(text) <= MAX_DIGEST_TEXT for text in network)
+    assert sum(text.count("TICKET-") for text in network) == 100
+
+
+if __name__ == "__main__":
+    test_marks_fire_in_order()
+    test_late_start_raises_one_alert()
+    test_resync_drops_closed_and_reschedules_priority_changes()
+    test_format_alert()
+    test_alert_digests_group_by_channel()
+    print("✅ SLA timer tests passed")
@@ -125,5 +125,17 @@ def test_slack_notifications():
         print(f"❌ slack_sdk: Not installed (will simulate)")
 
 
+def test_escalation_without_ticket_or_problem_is_rejected(monkeypatch):
+    """Nothing is posted when there is neither a ticket nor a problem to escalate."""
+    from ai_ticket_agent.tools import slack_handlers
+
+    def fail_post(channel, message):
+        raise AssertionError("an empty escalation was posted")
+
+    monkeypatch.setattr(slack_handlers, "send_slack_notification", fail_post)
+    result = escalate_to_slack(team_assignment="Software Team")
+    assert result.startswith("ERROR:")
+
+
 if __name__ == "__main__":
     test_slack_notifications() 
\ No newline at end of file
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Test keyword triage over the IT support taxonomy."""
+
+import sys
+import os
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_ticket_agent.taxonomy import CHANNEL_TEAMS, TEAM_CHANNELS, match_priority, match_route, match_team, match_triage
+
+
+def test_match_team():
+    """A clear keyword majority picks the team; weak or mixed text does not."""
+    assert match_team("My VPN keeps dropping and the Wi-Fi connectivity is bad") == "Network Team"
+    assert match_team("Suspicious PHISHING email, maybe malware") == "Security Team"
+    assert match_team("The CRM application crashes on login") == "Software Team"
+    assert match_team("Server outage: DNS and DHCP are failing") == "Infrastructure Team"
+    assert match_team("I need help with something") is None
+    assert match_team("vpn") is None
+    # Keywords only count as whole words
+    assert match_team("unvpn firewalls") is None
+
+
+def test_match_priority():
+    """The most urgent keyword level wins, otherwise medium."""
+    assert match_priority("URGENT: ransomware on the file share") == "critical"
+    assert match_priority("Need this asap for a deadline") == "high"
+    assert match_priority("My mouse is a bit slow") == "medium"
+
+
+def test_match_triage():
+    """One scan gives the same team and priority as the separate matchers."""
+    for text in ["URGENT: VPN and wifi connectivity down", "Server outage", "hello"]:
+        assert match_triage(text) == (match_team(text), match_priority(text))
+
+
+def test_match_route():
+    """Critical tickets always escalate; only escalation-only teams route by keyword."""
+    assert match_route("Network Team", "critical") == "escalation_agent"
+    assert match_route("Security Team", "medium") == "escalation_agent"
+    assert match_route("Infrastructure Team", "low") == "escalation_agent"
+    assert match_route(None, "critical") == "escalation_agent"
+    assert match_route(None, "medium") is None
+    # Teams with both self-service and escalation issues are left to the LLM
+    assert match_route("Access Management", "high") is None
+    assert match_route(*match_triage("My printer and scanner are not working after setup")) is None
+    assert match_route(*match_triage("The CRM application crashes, urgent deadline")) is None
+
+
+def test_channel_maps_agree():
+    """Every team channel maps back to its team."""
+    for team, channel in TEAM_CHANNELS.items():
+        assert CHANNEL_TEAMS[channel[len("#it-"):].split("-")[0]] == team
+
+
+if __name__ == "__main__":
+    test_match_team()
+    test_match_priority()
+    test_match_triage()
+    test_match_route()
+    test_channel_maps_agree()
+    print("✅ Taxonomy tests passed")